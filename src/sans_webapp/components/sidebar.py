@@ -325,11 +325,10 @@ def render_ai_chat_sidebar(api_key: Optional[str], fitter: SANSFitter) -> None:
                 chat_container = st.container(height=CHAT_HISTORY_HEIGHT)
                 with chat_container:
                     for _i, message in enumerate(st.session_state.chat_history):
+                        # The role header goes inside the message box: one element per message
                         if message['role'] == 'user':
-                            st.markdown('**🧑 You:**')
-                            st.info(message['content'])
+                            st.info(f'**🧑 You:**\n\n{message["content"]}')
                         else:
-                            st.markdown('**🤖 Assistant:**')
                             # Check for tool usage in response
                             content = message['content']
 
@@ -338,12 +337,12 @@ def render_ai_chat_sidebar(api_key: Optional[str], fitter: SANSFitter) -> None:
                                 # Split out tool invocation log
                                 parts = content.rsplit('\n\n[Used tool:', 1)
                                 main_response = parts[0]
-                                st.success(main_response)
+                                st.success(f'**🤖 Assistant:**\n\n{main_response}')
                                 if len(parts) > 1:
                                     tool_log = '[Used tool:' + parts[1]
                                     st.caption(f'🔧 {tool_log}')
                             else:
-                                st.success(content)
+                                st.success(f'**🤖 Assistant:**\n\n{content}')
 
                             # If the assistant asked the user to enable AI tools, offer an inline button
                             try:
@@ -6,6 +6,7 @@ Tools allow Claude to interact with SANSFitter: list models,
 set parameters, run fits, and query results.
 """
 
+from functools import lru_cache
 from typing import Any
 
 from sans_fitter import SANSFitter, get_all_models
@@ -150,15 +151,22 @@ def _check_tools_enabled() -> bool:
 # =============================================================================
 
 
+@lru_cache(maxsize=1)
+def list_sans_models_raw() -> tuple[str, ...]:
+    """
+    Sorted names of all available SANS models.
+    The sasmodels registry does not change at runtime, so the result is cached.
+    """
+    return tuple(sorted(get_all_models()))
+
+
 def list_sans_models() -> str:
     """
     List all available SANS models from sasmodels library.
     Returns a formatted list of model names that can be used with set-model.
     """
-    models = get_all_models()
-    return f'Available SANS models ({len(models)}):\n' + '\n'.join(
-        f'  - {m}' for m in sorted(models)
-    )
+    models = list_sans_models_raw()
+    return f'Available SANS models ({len(models)}):\n' + '\n'.join(f'  - {m}' for m in models)
 
 
 def get_model_parameters(model_name: str) -> str:
@@ -394,6 +402,9 @@ def set_multiple_parameters(parameters: dict[str, dict]) -> str:
     if not _check_tools_enabled():
         return 'AI tools are disabled. Enable them in the sidebar to allow parameter changes.'
 
+    if not parameters:
+        return 'No parameters to update.'
+
     try:
         from sans_webapp.services.mcp_state_bridge import get_state_bridge
 
@@ -401,44 +412,50 @@ def set_multiple_parameters(parameters: dict[str, dict]) -> str:
         fitter = get_fitter()
         bridge = get_state_bridge()
         results = []
-
-        for name, settings in parameters.items():
-            if name not in fitter.params:
-                results.append(f'  - {name}: NOT FOUND')
-                continue
-
-            changes = []
-
-            # Build kwargs for fitter.set_param()
-            kwargs: dict[str, Any] = {}
-            if 'value' in settings:
-                kwargs['value'] = settings['value']
-                changes.append(f'value={settings["value"]}')
-            if 'min' in settings:
-                kwargs['min'] = settings['min']
-                changes.append(f'min={settings["min"]}')
-            if 'max' in settings:
-                kwargs['max'] = settings['max']
-                changes.append(f'max={settings["max"]}')
-            if 'vary' in settings:
-                kwargs['vary'] = settings['vary']
-                changes.append(f'vary={settings["vary"]}')
-
-            if kwargs:
-                fitter.set_param(name, **kwargs)
-
-            # Update UI widget via bridge
-            bridge.set_parameter_widget(
-                name,
-                value=settings.get('value'),
-                min_val=settings.get('min'),
-                max_val=settings.get('max'),
-                vary=settings.get('vary'),
-            )
-
-            results.append(f'  - {name}: {", ".join(changes)}')
-
-        bridge.set_needs_rerun(True)
+        widget_updates: dict[str, dict] = {}
+        fitter_changed = False
+
+        try:
+            for name, settings in parameters.items():
+                if name not in fitter.params:
+                    results.append(f'  - {name}: NOT FOUND')
+                    continue
+
+                changes = []
+
+                # Build kwargs for fitter.set_param()
+                kwargs: dict[str, Any] = {}
+                if 'value' in settings:
+                    kwargs['value'] = settings['value']
+                    changes.append(f'value={settings["value"]}')
+                if 'min' in settings:
+                    kwargs['min'] = settings['min']
+                    changes.append(f'min={settings["min"]}')
+                if 'max' in settings:
+                    kwargs['max'] = settings['max']
+                    changes.append(f'max={settings["max"]}')
+                if 'vary' in settings:
+                    kwargs['vary'] = settings['vary']
+                    changes.append(f'vary={settings["vary"]}')
+
+                if kwargs:
+                    before = dict(fitter.params[name])
+                    fitter.set_param(name, **kwargs)
+                    fitter_changed = fitter_changed or fitter.params[name] != before
+
+                widget_updates[name] = settings
+                results.append(f'  - {name}: {", ".join(changes)}')
+        except Exception:
+            # Keep the UI in step with the parameters already applied to the fitter
+            bridge.set_parameter_widgets(widget_updates)
+            raise
+
+        # Update UI widgets via bridge in one batch
+        widgets_changed = bridge.set_parameter_widgets(widget_updates)
+
+        # Rerun only if the fitter or a widget actually changed; plots depend on both
+        if fitter_changed or widgets_changed:
+            bridge.set_needs_rerun(True)
 
         return 'Parameters updated:\n' + '\n'.join(results)
     except Exception as e:
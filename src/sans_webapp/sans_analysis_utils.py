@@ -17,6 +17,7 @@ __all__ = [
     'get_all_models',
     'analyze_data_for_ai_suggestion',
     'suggest_models_simple',
+    'suggest_models_simple_batch',
     'plot_data_and_fit',
     'calculate_residuals',
     'plot_data_fit_and_residuals',
@@ -78,6 +79,34 @@ def suggest_models_simple(q_data: np.ndarray, i_data: np.ndarray) -> list[str]:
     # Calculate slope
     slope = np.polyfit(log_q, log_i, 1)[0]
 
+    return _suggest_models_for_slope(slope)
+
+
+def suggest_models_simple_batch(q_data: np.ndarray, i_matrix: np.ndarray) -> list[list[str]]:
+    """
+    Heuristic model suggestion for several intensity curves sharing one Q grid.
+
+    All log-log slopes are obtained from a single ``np.polyfit`` call, which fits
+    every column of its ``y`` argument at once.
+
+    Args:
+        q_data: Q values, shape (n_points,)
+        i_matrix: Intensity values, shape (n_curves, n_points)
+
+    Returns:
+        List of suggested model names for each curve, in row order
+    """
+    log_i = np.log10(np.atleast_2d(i_matrix) + 1e-10)
+    log_q = np.log10(q_data + 1e-10)
+
+    # polyfit fits each column of y independently; rows are curves here
+    slopes = np.polyfit(log_q, log_i.T, 1)[0]
+
+    return [_suggest_models_for_slope(slope) for slope in slopes]
+
+
+def _suggest_models_for_slope(slope: float) -> list[str]:
+    """Map a log-log power-law slope to a list of candidate model names."""
     suggestions = []
 
     # Heuristic rules based on slope and shape
@@ -5,11 +5,16 @@ Contains service modules for AI chat and session state management.
 """
 
 from sans_webapp.services.ai_chat import send_chat_message, suggest_models_ai
-from sans_webapp.services.session_state import clamp_for_display, init_session_state
+from sans_webapp.services.session_state import (
+    clamp_for_display,
+    clamp_for_display_array,
+    init_session_state,
+)
 
 __all__ = [
     'send_chat_message',
     'suggest_models_ai',
     'clamp_for_display',
+    'clamp_for_display_array',
     'init_session_state',
 ]
@@ -8,8 +8,6 @@ Handles tool invocation round-trips between Claude and the embedded MCP server.
 import os
 from typing import Any
 
-from anthropic import Anthropic
-
 # Tool name to function mapping - built from MCP server
 _tool_handlers: dict[str, callable] = {}
 
@@ -70,180 +68,184 @@ def _build_tool_handlers() -> dict[str, callable]:
     return _tool_handlers
 
 
-def get_mcp_tool_schemas() -> list[dict[str, Any]]:
-    """
-    Extract tool schemas from the MCP server for Claude's tool-use API.
-
-    Returns:
-        List of tool definitions in Anthropic's tool schema format.
-    """
-    tools = [
-        {
-            'name': 'list-sans-models',
-            'description': 'List all available SANS models from sasmodels library. Returns a formatted list of model names that can be used with set-model.',
-            'input_schema': {
-                'type': 'object',
-                'properties': {},
-                'required': [],
-            },
+# Tool definitions in Anthropic's tool schema format. Built once at import time;
+# the tuple is shared by every caller, so it must not be mutated.
+_TOOL_SCHEMAS: tuple[dict[str, Any], ...] = (
+    {
+        'name': 'list-sans-models',
+        'description': 'List all available SANS models from sasmodels library. Returns a formatted list of model names that can be used with set-model.',
+        'input_schema': {
+            'type': 'object',
+            'properties': {},
+            'required': [],
         },
-        {
-            'name': 'get-model-parameters',
-            'description': 'Get parameter details for a specific SANS model. Shows parameter names, default values, units, and descriptions.',
-            'input_schema': {
-                'type': 'object',
-                'properties': {
-                    'model_name': {
-                        'type': 'string',
-                        'description': "Name of the model (e.g., 'sphere', 'cylinder')",
-                    }
-                },
-                'required': ['model_name'],
+    },
+    {
+        'name': 'get-model-parameters',
+        'description': 'Get parameter details for a specific SANS model. Shows parameter names, default values, units, and descriptions.',
+        'input_schema': {
+            'type': 'object',
+            'properties': {
+                'model_name': {
+                    'type': 'string',
+                    'description': "Name of the model (e.g., 'sphere', 'cylinder')",
+                }
             },
+            'required': ['model_name'],
         },
-        {
-            'name': 'get-current-state',
-            'description': 'Get the current state of the SANS fitter. Shows loaded data info, current model, and parameter values.',
-            'input_schema': {
-                'type': 'object',
-                'properties': {},
-                'required': [],
-            },
+    },
+    {
+        'name': 'get-current-state',
+        'description': 'Get the current state of the SANS fitter. Shows loaded data info, current model, and parameter values.',
+        'input_schema': {
+            'type': 'object',
+            'properties': {},
+            'required': [],
         },
-        {
-            'name': 'get-fit-results',
-            'description': 'Get the results from the most recent fit. Shows optimized parameter values, uncertainties, and fit statistics.',
-            'input_schema': {
-                'type': 'object',
-                'properties': {},
-                'required': [],
-            },
+    },
+    {
+        'name': 'get-fit-results',
+        'description': 'Get the results from the most recent fit. Shows optimized parameter values, uncertainties, and fit statistics.',
+        'input_schema': {
+            'type': 'object',
+            'properties': {},
+            'required': [],
         },
-        {
-            'name': 'set-model',
-            'description': 'Load a SANS model for fitting.',
-            'input_schema': {
-                'type': 'object',
-                'properties': {
-                    'model_name': {
-                        'type': 'string',
-                        'description': "Name of the model to load (e.g., 'sphere', 'cylinder', 'ellipsoid')",
-                    }
-                },
-                'required': ['model_name'],
+    },
+    {
+        'name': 'set-model',
+        'description': 'Load a SANS model for fitting.',
+        'input_schema': {
+            'type': 'object',
+            'properties': {
+                'model_name': {
+                    'type': 'string',
+                    'description': "Name of the model to load (e.g., 'sphere', 'cylinder', 'ellipsoid')",
+                }
             },
+            'required': ['model_name'],
         },
-        {
-            'name': 'set-parameter',
-            'description': "Set a parameter's value and/or fitting options.",
-            'input_schema': {
-                'type': 'object',
-                'properties': {
-                    'name': {
-                        'type': 'string',
-                        'description': "Parameter name (e.g., 'radius', 'sld')",
-                    },
-                    'value': {
-                        'type': 'number',
-                        'description': 'New value for the parameter (optional)',
-                    },
-                    'min_bound': {
-                        'type': 'number',
-                        'description': 'Minimum bound for fitting (optional)',
-                    },
-                    'max_bound': {
-                        'type': 'number',
-                        'description': 'Maximum bound for fitting (optional)',
-                    },
-                    'vary': {
-                        'type': 'boolean',
-                        'description': 'Whether parameter should vary during fitting (optional)',
-                    },
+    },
+    {
+        'name': 'set-parameter',
+        'description': "Set a parameter's value and/or fitting options.",
+        'input_schema': {
+            'type': 'object',
+            'properties': {
+                'name': {
+                    'type': 'string',
+                    'description': "Parameter name (e.g., 'radius', 'sld')",
+                },
+                'value': {
+                    'type': 'number',
+                    'description': 'New value for the parameter (optional)',
+                },
+                'min_bound': {
+                    'type': 'number',
+                    'description': 'Minimum bound for fitting (optional)',
+                },
+                'max_bound': {
+                    'type': 'number',
+                    'description': 'Maximum bound for fitting (optional)',
+                },
+                'vary': {
+                    'type': 'boolean',
+                    'description': 'Whether parameter should vary during fitting (optional)',
                 },
-                'required': ['name'],
             },
+            'required': ['name'],
         },
-        {
-            'name': 'set-multiple-parameters',
-            'description': 'Set multiple parameters at once.',
-            'input_schema': {
-                'type': 'object',
-                'properties': {
-                    'parameters': {
+    },
+    {
+        'name': 'set-multiple-parameters',
+        'description': 'Set multiple parameters at once.',
+        'input_schema': {
+            'type': 'object',
+            'properties': {
+                'parameters': {
+                    'type': 'object',
+                    'description': "Dictionary mapping parameter names to their settings. Each value is a dict with optional keys: 'value', 'min', 'max', 'vary'. Example: {\"radius\": {\"value\": 50, \"vary\": true}}",
+                    'additionalProperties': {
                         'type': 'object',
-                        'description': "Dictionary mapping parameter names to their settings. Each value is a dict with optional keys: 'value', 'min', 'max', 'vary'. Example: {\"radius\": {\"value\": 50, \"vary\": true}}",
-                        'additionalProperties': {
-                            'type': 'object',
-                            'properties': {
-                                'value': {'type': 'number'},
-                                'min': {'type': 'number'},
-                                'max': {'type': 'number'},
-                                'vary': {'type': 'boolean'},
-                            },
+                        'properties': {
+                            'value': {'type': 'number'},
+                            'min': {'type': 'number'},
+                            'max': {'type': 'number'},
+                            'vary': {'type': 'boolean'},
                         },
-                    }
-                },
-                'required': ['parameters'],
-            },
-        },
-        {
-            'name': 'enable-polydispersity',
-            'description': 'Enable polydispersity for a size parameter.',
-            'input_schema': {
-                'type': 'object',
-                'properties': {
-                    'parameter_name': {
-                        'type': 'string',
-                        'description': "Name of the parameter to make polydisperse (e.g., 'radius')",
-                    },
-                    'pd_type': {
-                        'type': 'string',
-                        'description': "Distribution type ('gaussian', 'lognormal', 'schulz')",
-                        'default': 'gaussian',
                     },
-                    'pd_value': {
-                        'type': 'number',
-                        'description': 'Width of the distribution (relative, typically 0.01-0.5)',
-                        'default': 0.1,
-                    },
-                },
-                'required': ['parameter_name'],
+                }
             },
+            'required': ['parameters'],
         },
-        {
-            'name': 'set-structure-factor',
-            'description': 'Add a structure factor to account for interparticle interactions.',
-            'input_schema': {
-                'type': 'object',
-                'properties': {
-                    'sf_name': {
-                        'type': 'string',
-                        'description': "Structure factor name (e.g., 'hardsphere', 'stickyhardsphere', 'squarewell')",
-                    }
+    },
+    {
+        'name': 'enable-polydispersity',
+        'description': 'Enable polydispersity for a size parameter.',
+        'input_schema': {
+            'type': 'object',
+            'properties': {
+                'parameter_name': {
+                    'type': 'string',
+                    'description': "Name of the parameter to make polydisperse (e.g., 'radius')",
+                },
+                'pd_type': {
+                    'type': 'string',
+                    'description': "Distribution type ('gaussian', 'lognormal', 'schulz')",
+                    'default': 'gaussian',
+                },
+                'pd_value': {
+                    'type': 'number',
+                    'description': 'Width of the distribution (relative, typically 0.01-0.5)',
+                    'default': 0.1,
                 },
-                'required': ['sf_name'],
             },
+            'required': ['parameter_name'],
         },
-        {
-            'name': 'remove-structure-factor',
-            'description': 'Remove any structure factor from the current model.',
-            'input_schema': {
-                'type': 'object',
-                'properties': {},
-                'required': [],
+    },
+    {
+        'name': 'set-structure-factor',
+        'description': 'Add a structure factor to account for interparticle interactions.',
+        'input_schema': {
+            'type': 'object',
+            'properties': {
+                'sf_name': {
+                    'type': 'string',
+                    'description': "Structure factor name (e.g., 'hardsphere', 'stickyhardsphere', 'squarewell')",
+                }
             },
+            'required': ['sf_name'],
         },
-        {
-            'name': 'run-fit',
-            'description': 'Run the curve fitting optimization. Uses the currently loaded model and parameter settings to fit the data. Returns fit quality metrics and optimized parameter values.',
-            'input_schema': {
-                'type': 'object',
-                'properties': {},
-                'required': [],
-            },
+    },
+    {
+        'name': 'remove-structure-factor',
+        'description': 'Remove any structure factor from the current model.',
+        'input_schema': {
+            'type': 'object',
+            'properties': {},
+            'required': [],
+        },
+    },
+    {
+        'name': 'run-fit',
+        'description': 'Run the curve fitting optimization. Uses the currently loaded model and parameter settings to fit the data. Returns fit quality metrics and optimized parameter values.',
+        'input_schema': {
+            'type': 'object',
+            'properties': {},
+            'required': [],
         },
-    ]
-    return tools
+    },
+)
+
+
+def get_mcp_tool_schemas() -> tuple[dict[str, Any], ...]:
+    """
+    Extract tool schemas from the MCP server for Claude's tool-use API.
+
+    Returns:
+        Tuple of tool definitions in Anthropic's tool schema format.
+    """
+    return _TOOL_SCHEMAS
 
 
 def execute_tool(tool_name: str, tool_input: dict[str, Any]) -> str:
@@ -301,6 +303,9 @@ class ClaudeMCPClient:
             f'[Claude client] Creating client with key prefix: {prefix}... (len={len(self.api_key)})'
         )
 
+        # Imported here so the SDK is only loaded once a valid key is available
+        from anthropic import Anthropic
+
         self.client = Anthropic(api_key=self.api_key)
         self.model = 'claude-sonnet-4-20250514'
         self.tools = get_mcp_tool_schemas()
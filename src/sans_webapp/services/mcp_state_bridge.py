@@ -12,6 +12,22 @@ from sans_fitter import SANSFitter
 
 from sans_webapp.services.session_state import clamp_for_display
 
+# Widget keys per parameter name, built once: (value_, min_, max_, vary_)
+_WIDGET_KEY_CACHE: dict[str, tuple[str, str, str, str]] = {}
+
+
+def _widget_keys(param_name: str) -> tuple[str, str, str, str]:
+    """Return the cached (value, min, max, vary) widget keys for a parameter."""
+    keys = _WIDGET_KEY_CACHE.get(param_name)
+    if keys is None:
+        keys = _WIDGET_KEY_CACHE[param_name] = (
+            f'value_{param_name}',
+            f'min_{param_name}',
+            f'max_{param_name}',
+            f'vary_{param_name}',
+        )
+    return keys
+
 
 class SessionStateBridge:
     """
@@ -216,14 +232,51 @@ class SessionStateBridge:
 
         Only sets provided values (non-None arguments).
         """
+        value_key, min_key, max_key, vary_key = _widget_keys(param_name)
         if value is not None:
-            st.session_state[f'value_{param_name}'] = clamp_for_display(value)
+            st.session_state[value_key] = clamp_for_display(value)
         if min_val is not None:
-            st.session_state[f'min_{param_name}'] = clamp_for_display(min_val)
+            st.session_state[min_key] = clamp_for_display(min_val)
         if max_val is not None:
-            st.session_state[f'max_{param_name}'] = clamp_for_display(max_val)
+            st.session_state[max_key] = clamp_for_display(max_val)
         if vary is not None:
-            st.session_state[f'vary_{param_name}'] = vary
+            st.session_state[vary_key] = vary
+
+    def set_parameter_widgets(self, parameters: dict[str, dict[str, Any]]) -> bool:
+        """
+        Set widget state for several parameters in a single session state update.
+
+        Only widgets whose value actually changes are written.
+
+        Args:
+            parameters: Maps parameter names to settings with optional
+                'value', 'min', 'max' and 'vary' keys. Missing or None
+                settings leave the corresponding widget untouched.
+
+        Returns:
+            True if any widget value changed, False otherwise.
+        """
+        updates: dict[str, Any] = {}
+        for name, settings in parameters.items():
+            value_key, min_key, max_key, vary_key = _widget_keys(name)
+            if settings.get('value') is not None:
+                updates[value_key] = clamp_for_display(settings['value'])
+            if settings.get('min') is not None:
+                updates[min_key] = clamp_for_display(settings['min'])
+            if settings.get('max') is not None:
+                updates[max_key] = clamp_for_display(settings['max'])
+            if settings.get('vary') is not None:
+                updates[vary_key] = settings['vary']
+
+        session_state = st.session_state
+        changed = {
+            key: value
+            for key, value in updates.items()
+            if key not in session_state or session_state[key] != value
+        }
+        if changed:
+            session_state.update(changed)
+        return bool(changed)
 
     # Polydispersity widget state management
 
@@ -6,10 +6,25 @@ Centralizes all session state initialization and utility functions.
 
 import numpy as np
 import streamlit as st
+from numpy.typing import ArrayLike
 from sans_fitter import SANSFitter
 
 from sans_webapp.ui_constants import MAX_FLOAT_DISPLAY, MIN_FLOAT_DISPLAY
 
+# Per-parameter widget keys (e.g. 'value_radius', 'pd_width_radius') removed by
+# clear_parameter_state, as one tuple for a single str.startswith call per key
+_PARAM_KEY_PREFIXES = (
+    'value_',
+    'min_',
+    'max_',
+    'vary_',
+    'pd_width_',
+    'pd_n_',
+    'pd_type_',
+    'pd_vary_',
+)
+_PD_STATE_KEYS = frozenset({'pd_enabled', 'pd_updates'})
+
 
 def init_session_state() -> None:
     """Initialize Streamlit session state with defaults."""
@@ -55,21 +70,28 @@ def clamp_for_display(value: float) -> float:
     return value
 
 
+def clamp_for_display_array(values: ArrayLike) -> np.ndarray:
+    """
+    Vectorized clamp_for_display for whole arrays (e.g. a results table column).
+
+    Args:
+        values: Array-like of values to clamp
+
+    Returns:
+        Float64 array with inf/-inf replaced by the displayable bounds
+    """
+    arr = np.asarray(values, dtype=np.float64)
+    return np.where(
+        np.isposinf(arr), MAX_FLOAT_DISPLAY, np.where(np.isneginf(arr), MIN_FLOAT_DISPLAY, arr)
+    )
+
+
 def clear_parameter_state() -> None:
     """Clear all parameter-related session state keys."""
     keys_to_remove = [
         k
         for k in st.session_state.keys()
-        if k.startswith('value_')
-        or k.startswith('min_')
-        or k.startswith('max_')
-        or k.startswith('vary_')
-        or k.startswith('pd_width_')
-        or k.startswith('pd_n_')
-        or k.startswith('pd_type_')
-        or k.startswith('pd_vary_')
-        or k == 'pd_enabled'
-        or k == 'pd_updates'
+        if k.startswith(_PARAM_KEY_PREFIXES) or k in _PD_STATE_KEYS
     ]
     for key in keys_to_remove:
         del st.session_state[key]
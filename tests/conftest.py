@@ -2,64 +2,85 @@
 Shared pytest fixtures for SANS-webapp tests.
 """
 
+import copy
+from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import numpy as np
 import pytest
 
-
-class MockSessionState:
-    """Mock for Streamlit session_state."""
+SIMULATED_DATA_PATH = Path(__file__).resolve().parent.parent / 'simulated_sans_data.csv'
+
+
+# Shared synthetic curve: Porod (q^-4) decay on a log-spaced Q grid. The arrays
+# are read-only so no test can mutate data other tests rely on.
+Q_TEST = np.logspace(-3, -1, 50)
+I_TEST = 100.0 * Q_TEST ** (-4) + 0.1
+Q_TEST.setflags(write=False)
+I_TEST.setflags(write=False)
+
+# Lorentzian curve written to the synthetic_sphere_csv fixture (read-only as above)
+LORENTZ_Q = np.logspace(-2, 0, 30)
+LORENTZ_I = 0.01 / (1 + (LORENTZ_Q * 50) ** 2) + 0.001
+LORENTZ_DI = LORENTZ_I * 0.1
+LORENTZ_Q.setflags(write=False)
+LORENTZ_I.setflags(write=False)
+LORENTZ_DI.setflags(write=False)
+
+SESSION_STATE_DEFAULTS = {
+    'ai_tools_enabled': True,
+    'needs_rerun': False,
+    'current_model': None,
+    'model_selected': False,
+    'data_loaded': False,
+    'fit_completed': False,
+    'fit_status': 'idle',
+    'fit_result': None,
+    'fit_error': None,
+    'chat_history': [],
+    'chat_api_key': None,
+    'show_ai_chat': True,
+    'expand_data_upload': True,
+    'expand_model_selection': False,
+    'expand_fitting': False,
+    'fitter': None,
+}
+
+
+class MockSessionState(dict):
+    """Mock for Streamlit session_state.
+
+    A plain dict, so item access, get(), `in`, update() and deletion all run at C
+    speed. Attribute access maps onto the same keys; missing keys read as None.
+    """
+
+    __slots__ = ()
 
     def __init__(self):
-        self._data = {
-            'ai_tools_enabled': True,
-            'needs_rerun': False,
-            'current_model': None,
-            'model_selected': False,
-            'data_loaded': False,
-            'fit_completed': False,
-            'fit_status': 'idle',
-            'fit_result': None,
-            'fit_error': None,
-            'chat_history': [],
-            'chat_api_key': None,
-            'show_ai_chat': True,
-            'expand_data_upload': True,
-            'expand_model_selection': False,
-            'expand_fitting': False,
-            'fitter': None,
-        }
+        super().__init__(SESSION_STATE_DEFAULTS)
+        self['chat_history'] = []
 
     def __getattr__(self, name):
         if name.startswith('_'):
-            return super().__getattribute__(name)
-        return self._data.get(name)
+            raise AttributeError(name)
+        return self.get(name)
 
     def __setattr__(self, name, value):
-        if name.startswith('_'):
-            super().__setattr__(name, value)
-        else:
-            self._data[name] = value
-
-    def __getitem__(self, key):
-        return self._data[key]
-
-    def __setitem__(self, key, value):
-        self._data[key] = value
-
-    def get(self, key, default=None):
-        return self._data.get(key, default)
+        self[name] = value
 
-    def __contains__(self, key):
-        return key in self._data
+    def __delitem__(self, key):
+        self.pop(key, None)
 
-    def keys(self):
-        return self._data.keys()
 
-    def __delitem__(self, key):
-        if key in self._data:
-            del self._data[key]
+# Parameter records installed by MockFitter.set_model, built once at import
+SPHERE_PARAMS = {
+    'radius': {'value': 50.0, 'min': 1, 'max': 500, 'vary': True, 'description': ''},
+    'sld': {'value': 1e-6, 'min': 0, 'max': 1e-5, 'vary': True, 'description': ''},
+    'sld_solvent': {'value': 6e-6, 'min': 0, 'max': 1e-5, 'vary': False, 'description': ''},
+    'background': {'value': 0.001, 'min': 0, 'max': 1, 'vary': True, 'description': ''},
+    'scale': {'value': 1.0, 'min': 0.001, 'max': 10, 'vary': True, 'description': ''},
+}
 
 
 class MockFitter:
@@ -73,15 +94,11 @@ class MockFitter:
         self.result = None
 
     def set_model(self, model_name: str):
-        self.kernel = MagicMock()
+        # Code under test only checks the kernel for None; a namespace is enough
+        self.kernel = SimpleNamespace(info=SimpleNamespace(name=model_name))
         self.model_name = model_name
-        self.params = {
-            'radius': {'value': 50.0, 'min': 1, 'max': 500, 'vary': True, 'description': ''},
-            'sld': {'value': 1e-6, 'min': 0, 'max': 1e-5, 'vary': True, 'description': ''},
-            'sld_solvent': {'value': 6e-6, 'min': 0, 'max': 1e-5, 'vary': False, 'description': ''},
-            'background': {'value': 0.001, 'min': 0, 'max': 1, 'vary': True, 'description': ''},
-            'scale': {'value': 1.0, 'min': 0.001, 'max': 10, 'vary': True, 'description': ''},
-        }
+        # Copy each record: set_param and the code under test mutate them in place
+        self.params = {name: dict(info) for name, info in SPHERE_PARAMS.items()}
         return self
 
     def set_param(self, name: str, **kwargs):
@@ -115,12 +132,52 @@ class MockFitter:
         return self
 
 
+def build_sphere_fitter():
+    """Build a real SANSFitter with the simulated data and sphere model loaded."""
+    from sans_fitter import SANSFitter
+
+    fitter = SANSFitter()
+    fitter.load_data(str(SIMULATED_DATA_PATH))
+    fitter.set_model('sphere')
+    return fitter
+
+
+@pytest.fixture(scope='session')
+def qi_data():
+    """Shared read-only (Q, I) arrays for a steep Porod-law curve."""
+    return Q_TEST, I_TEST
+
+
+@pytest.fixture(scope='session')
+def synthetic_sphere_csv(tmp_path_factory):
+    """Path to a 30-point Lorentzian Q,I,dI CSV, written once per session."""
+    path = tmp_path_factory.mktemp('data') / 'synthetic_sphere.csv'
+    np.savetxt(
+        path,
+        np.column_stack([LORENTZ_Q, LORENTZ_I, LORENTZ_DI]),
+        delimiter=',',
+        fmt='%.17g',
+        header='Q,I,dI',
+        comments='',
+    )
+    return str(path)
+
+
 @pytest.fixture
 def mock_session_state():
     """Create a fresh mock session state."""
     return MockSessionState()
 
 
+@pytest.fixture
+def patched_bridge_st(monkeypatch, mock_session_state):
+    """Point mcp_state_bridge.st at a namespace holding the test's MockSessionState."""
+    from sans_webapp.services import mcp_state_bridge
+
+    monkeypatch.setattr(mcp_state_bridge, 'st', SimpleNamespace(session_state=mock_session_state))
+    return mock_session_state
+
+
 @pytest.fixture
 def mock_fitter():
     """Create a fresh mock fitter."""
@@ -150,3 +207,51 @@ def mock_fitter_full():
     fitter.load_data('test_data.csv')
     fitter.set_model('sphere')
     return fitter
+
+
+@pytest.fixture(scope='session')
+def sphere_fitter():
+    """Real SANSFitter with data and sphere model, built once per session.
+
+    Shared between tests, so tests must treat it as read-only.
+    """
+    return build_sphere_fitter()
+
+
+@pytest.fixture(scope='session')
+def fitter_factory():
+    """Return make(model_name, read_only=False) building real SANSFitters per model.
+
+    By default callers get a freshly built fitter they may mutate. A deep copy is
+    not an option: the copied sasmodels kernel no longer evaluates the model.
+    read_only=True hands back a shared instance, loaded once per session per model.
+    """
+    from sans_fitter import SANSFitter
+
+    cache = {}
+
+    def build(model_name):
+        fitter = SANSFitter()
+        fitter.set_model(model_name)
+        return fitter
+
+    def make(model_name, read_only=False):
+        if not read_only:
+            return build(model_name)
+        if model_name not in cache:
+            cache[model_name] = build(model_name)
+        return cache[model_name]
+
+    return make
+
+
+@pytest.fixture(scope='session')
+def mock_sphere_fitter():
+    """Mock fitter with the sphere model set, built once per session (read-only)."""
+    return MockFitter().set_model('sphere')
+
+
+@pytest.fixture
+def mock_sphere_fitter_copy(mock_sphere_fitter):
+    """Per-test deep copy of mock_sphere_fitter for tests that mutate the fitter."""
+    return copy.deepcopy(mock_sphere_fitter)
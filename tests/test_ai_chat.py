@@ -4,44 +4,14 @@ Unit tests for AI chat service with Claude MCP integration.
 Tests the modified ai_chat.py from Step 5.
 """
 
-from typing import Any
 from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pytest
 
-
-class MockSessionState:
-    """Mock for Streamlit session_state."""
-
-    def __init__(self):
-        self._data = {
-            'ai_tools_enabled': True,
-            'needs_rerun': False,
-            'current_model': 'sphere',
-            'model_selected': True,
-            'data_loaded': True,
-            'fit_completed': False,
-            'chat_history': [],
-            'fitter': None,
-        }
-
-    def __getattr__(self, name):
-        if name.startswith('_'):
-            return super().__getattribute__(name)
-        return self._data.get(name)
-
-    def __setattr__(self, name, value):
-        if name.startswith('_'):
-            super().__setattr__(name, value)
-        else:
-            self._data[name] = value
-
-    def get(self, key, default=None):
-        return self._data.get(key, default)
-
-    def __contains__(self, key):
-        return key in self._data
+# Session keys for a sphere model selected on loaded data, applied to the
+# shared MockSessionState
+SPHERE_SESSION = {'current_model': 'sphere', 'model_selected': True, 'data_loaded': True}
 
 
 class MockFitter:
@@ -65,6 +35,25 @@ def mock_fitter():
     return MockFitter()
 
 
+@pytest.fixture
+def patched_chat(mock_session_state):
+    """Patch Streamlit and the Claude client factory used by the chat service.
+
+    Yields:
+        Tuple of (mock_st, mock_get_client, mock_client). Tests adjust
+        mock_st.session_state or the client's return values as needed.
+    """
+    with (
+        patch('sans_webapp.services.ai_chat.st') as mock_st,
+        patch('sans_webapp.services.ai_chat.get_claude_client') as mock_get_client,
+    ):
+        mock_session_state.update(SPHERE_SESSION)
+        mock_st.session_state = mock_session_state
+        mock_client = MagicMock(spec=['simple_chat', 'chat'])
+        mock_get_client.return_value = mock_client
+        yield mock_st, mock_get_client, mock_client
+
+
 # =============================================================================
 # Test _build_context
 # =============================================================================
@@ -122,7 +111,7 @@ class TestSuggestModelsAI:
 
         with patch('sans_webapp.services.ai_chat.get_claude_client') as mock_client:
             # Mock the Claude client
-            mock_claude = MagicMock()
+            mock_claude = MagicMock(spec=['simple_chat', 'chat'])
             mock_claude.simple_chat.return_value = 'sphere\ncylinder\nellipsoid'
             mock_client.return_value = mock_claude
 
@@ -140,53 +129,43 @@ class TestSuggestModelsAI:
 class TestSendChatMessage:
     """Test the main chat message function."""
 
-    def test_send_chat_message_returns_string(self, mock_fitter):
+    def test_send_chat_message_returns_string(self, mock_fitter, patched_chat):
         """send_chat_message should return a string response."""
         from sans_webapp.services.ai_chat import send_chat_message
 
-        with patch('sans_webapp.services.ai_chat.get_claude_client') as mock_get_client:
-            with patch('sans_webapp.services.ai_chat.st') as mock_st:
-                mock_st.session_state = MockSessionState()
-
-                mock_client = MagicMock()
-                mock_client.simple_chat.return_value = 'Hello! How can I help?'
-                mock_get_client.return_value = mock_client
+        _mock_st, _mock_get_client, mock_client = patched_chat
+        mock_client.simple_chat.return_value = 'Hello! How can I help?'
 
-                result = send_chat_message('Hello', 'fake-api-key', mock_fitter)
+        result = send_chat_message('Hello', 'fake-api-key', mock_fitter)
 
-                assert isinstance(result, str)
-                assert len(result) > 0
+        assert isinstance(result, str)
+        assert len(result) > 0
 
-    def test_send_chat_message_handles_error(self, mock_fitter):
+    def test_send_chat_message_handles_error(self, mock_fitter, patched_chat):
         """send_chat_message should handle errors gracefully."""
         from sans_webapp.services.ai_chat import send_chat_message
 
-        with patch('sans_webapp.services.ai_chat.get_claude_client') as mock_get_client:
-            with patch('sans_webapp.services.ai_chat.st') as mock_st:
-                mock_st.session_state = MockSessionState()
-
-                mock_get_client.side_effect = Exception('API error')
+        _mock_st, mock_get_client, _mock_client = patched_chat
+        mock_get_client.side_effect = Exception('API error')
 
-                result = send_chat_message('Hello', 'fake-api-key', mock_fitter)
+        result = send_chat_message('Hello', 'fake-api-key', mock_fitter)
 
-                # Should return error message, not raise
-                assert isinstance(result, str)
-                assert 'error' in result.lower()
+        # Should return error message, not raise
+        assert isinstance(result, str)
+        assert 'error' in result.lower()
 
-    def test_prompt_user_to_enable_tools_for_mutation_requests(self, mock_fitter):
+    def test_prompt_user_to_enable_tools_for_mutation_requests(self, mock_fitter, patched_chat):
         """If tools are disabled and user requests a state change, prompt to enable them."""
         from sans_webapp.services.ai_chat import send_chat_message
 
-        with patch('sans_webapp.services.ai_chat.get_claude_client') as _mock_get_client:
-            with patch('sans_webapp.services.ai_chat.st') as mock_st:
-                # Simulate tools disabled
-                mock_st.session_state = MockSessionState()
-                mock_st.session_state.ai_tools_enabled = False
+        mock_st, _mock_get_client, _mock_client = patched_chat
+        # Simulate tools disabled
+        mock_st.session_state.ai_tools_enabled = False
 
-                response = send_chat_message('Change sld to 2.0', 'fake-api-key', mock_fitter)
+        response = send_chat_message('Change sld to 2.0', 'fake-api-key', mock_fitter)
 
-                assert isinstance(response, str)
-                assert 'enable' in response.lower() and 'ai tools' in response.lower()
+        assert isinstance(response, str)
+        assert 'enable' in response.lower() and 'ai tools' in response.lower()
 
     def test_response_requests_enable_tools_helper(self):
         """response_requests_enable_tools should detect the enable prompt in assistant text."""
@@ -198,6 +177,13 @@ class TestSendChatMessage:
         assert response_requests_enable_tools(positive) is True
         assert response_requests_enable_tools(negative) is False
 
+    def test_response_requests_enable_tools_matches_either_order(self):
+        """Detection should not depend on whether 'enable' precedes 'AI tools'."""
+        from sans_webapp.services.ai_chat import response_requests_enable_tools
+
+        assert response_requests_enable_tools('AI Tools are off; please enable them.') is True
+        assert response_requests_enable_tools('') is False
+
 
 # =============================================================================
 # Test send_chat_message_with_tools
@@ -207,15 +193,16 @@ class TestSendChatMessage:
 class TestSendChatMessageWithTools:
     """Test the tool-enabled chat function."""
 
-    def test_returns_response_and_tools_invoked(self, mock_fitter):
+    def test_returns_response_and_tools_invoked(self, mock_fitter, mock_session_state):
         """Should return both response and tool invocation info."""
         from sans_webapp.services.ai_chat import send_chat_message_with_tools
 
         with patch('sans_webapp.services.ai_chat.get_claude_client') as mock_get_client:
             with patch('sans_webapp.services.ai_chat.st') as mock_st:
-                mock_st.session_state = MockSessionState()
+                mock_session_state.update(SPHERE_SESSION)
+                mock_st.session_state = mock_session_state
 
-                mock_client = MagicMock()
+                mock_client = MagicMock(spec=['simple_chat', 'chat'])
                 mock_client.chat.return_value = ('Response text', [{'tool_name': 'set-model'}])
                 mock_get_client.return_value = mock_client
 
@@ -2,10 +2,13 @@
 Tests for app initialization of MCP server references and Claude client pre-warm.
 """
 
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
 
+from sans_webapp import app
+
 
 class MockSessionState(dict):
     def __getattr__(self, key):
@@ -18,60 +21,43 @@ class MockSessionState(dict):
         self[key] = value
 
 
-def test_init_mcp_and_ai_calls_setters_and_client_when_key_in_session():
-    from sans_webapp import app
-
-    mock_st = MagicMock()
-    mock_st.session_state = MockSessionState()
-    mock_st.session_state.fitter = 'FAKE_FITTER'
-    mock_st.session_state.chat_api_key = 'TEST_KEY'
+@pytest.fixture
+def mcp_mocks(monkeypatch):
+    """Patch app.st and the MCP/Claude entry points used by init_mcp_and_ai."""
+    mocks = SimpleNamespace(st=MagicMock(), set_fitter=MagicMock(), get_client=MagicMock())
+    mocks.st.session_state = MockSessionState(fitter='FAKE_FITTER')
 
-    with patch.object(app, 'st', mock_st):
-        with (
-            patch('sans_webapp.mcp_server.set_fitter') as mock_set_fitter,
-            patch('sans_webapp.services.claude_mcp_client.get_claude_client') as mock_get_client,
-        ):
-            app.init_mcp_and_ai()
+    monkeypatch.setattr(app, 'st', mocks.st)
+    monkeypatch.setattr('sans_webapp.mcp_server.set_fitter', mocks.set_fitter)
+    monkeypatch.setattr(
+        'sans_webapp.services.claude_mcp_client.get_claude_client', mocks.get_client
+    )
+    # Only the session key should count, not whatever the environment provides
+    monkeypatch.delenv('ANTHROPIC_API_KEY', raising=False)
+    return mocks
 
-            mock_set_fitter.assert_called_once_with('FAKE_FITTER')
-            mock_get_client.assert_called_once_with('TEST_KEY')
 
+def test_init_mcp_and_ai_calls_setters_and_client_when_key_in_session(mcp_mocks):
+    mcp_mocks.st.session_state.chat_api_key = 'TEST_KEY'
 
-def test_init_mcp_and_ai_calls_setters_but_not_client_when_no_key():
-    from sans_webapp import app
+    app.init_mcp_and_ai()
 
-    mock_st = MagicMock()
-    mock_st.session_state = MockSessionState()
-    mock_st.session_state.fitter = 'FAKE_FITTER'
+    mcp_mocks.set_fitter.assert_called_once_with('FAKE_FITTER')
+    mcp_mocks.get_client.assert_called_once_with('TEST_KEY')
 
-    with patch.object(app, 'st', mock_st):
-        with (
-            patch('sans_webapp.mcp_server.set_fitter') as mock_set_fitter,
-            patch('sans_webapp.services.claude_mcp_client.get_claude_client') as mock_get_client,
-        ):
-            app.init_mcp_and_ai()
 
-            mock_set_fitter.assert_called_once_with('FAKE_FITTER')
-            mock_get_client.assert_not_called()
+def test_init_mcp_and_ai_calls_setters_but_not_client_when_no_key(mcp_mocks):
+    app.init_mcp_and_ai()
 
+    mcp_mocks.set_fitter.assert_called_once_with('FAKE_FITTER')
+    mcp_mocks.get_client.assert_not_called()
 
-def test_init_mcp_and_ai_client_error_stored_in_session_state():
-    from sans_webapp import app
 
-    mock_st = MagicMock()
-    mock_st.session_state = MockSessionState()
-    mock_st.session_state.fitter = 'FAKE_FITTER'
-    mock_st.session_state.chat_api_key = 'BAD_KEY'
+def test_init_mcp_and_ai_client_error_stored_in_session_state(mcp_mocks):
+    mcp_mocks.st.session_state.chat_api_key = 'BAD_KEY'
+    mcp_mocks.get_client.side_effect = ValueError('bad key')
 
-    with patch.object(app, 'st', mock_st):
-        with (
-            patch('sans_webapp.mcp_server.set_fitter'),
-            patch(
-                'sans_webapp.services.claude_mcp_client.get_claude_client',
-                side_effect=ValueError('bad key'),
-            ),
-        ):
-            app.init_mcp_and_ai()
+    app.init_mcp_and_ai()
 
-            assert 'ai_client_error' in mock_st.session_state
-            assert 'bad key' in mock_st.session_state['ai_client_error']
+    assert 'ai_client_error' in mcp_mocks.st.session_state
+    assert 'bad key' in mcp_mocks.st.session_state['ai_client_error']
@@ -2,25 +2,33 @@
 Tests for environment configuration: .env.template and ANTHROPIC_API_KEY handling.
 """
 
-import os
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture(scope='session')
+def env_template():
+    """Contents of .env.template, read once per session."""
+    return (REPO_ROOT / '.env.template').read_text(encoding='utf-8')
+
+
+@pytest.fixture(scope='session')
+def webapp_readme():
+    """Contents of WEBAPP_README.md, read once per session."""
+    return (REPO_ROOT / 'WEBAPP_README.md').read_text(encoding='utf-8')
+
 
 # skip the test
 @pytest.mark.skip(
     reason='Tests for .env.template and environment variable handling, not critical for core functionality'
 )
-def test_env_template_contains_keys():
-    path = os.path.join(os.path.dirname(__file__), os.pardir, '.env.template')
-    path = os.path.abspath(path)
-
-    with open(path, encoding='utf-8') as fh:
-        content = fh.read()
-
-    assert 'ANTHROPIC_API_KEY' in content, '.env.template should contain ANTHROPIC_API_KEY'
-    assert 'OPENAI_API_KEY' not in content, (
+def test_env_template_contains_keys(env_template):
+    assert 'ANTHROPIC_API_KEY' in env_template, '.env.template should contain ANTHROPIC_API_KEY'
+    assert 'OPENAI_API_KEY' not in env_template, (
         '.env.template should not contain OPENAI_API_KEY (replaced by Anthropic)'
     )
 
@@ -54,11 +62,7 @@ def test_init_mcp_uses_anthropic_env_var_if_no_session_key():
 @pytest.mark.skip(
     reason='Tests for .env.template and environment variable handling, not critical for core functionality'
 )
-def test_readme_mentions_anthropic_key():
-    readme_path = os.path.join(os.path.dirname(__file__), os.pardir, 'WEBAPP_README.md')
-    readme_path = os.path.abspath(readme_path)
-
-    with open(readme_path, encoding='utf-8') as fh:
-        content = fh.read()
-
-    assert 'ANTHROPIC_API_KEY' in content, 'WEBAPP_README.md should document ANTHROPIC_API_KEY'
+def test_readme_mentions_anthropic_key(webapp_readme):
+    assert 'ANTHROPIC_API_KEY' in webapp_readme, (
+        'WEBAPP_README.md should document ANTHROPIC_API_KEY'
+    )
@@ -9,7 +9,55 @@ from typing import Any
 from unittest.mock import MagicMock, PropertyMock, patch
 
 import pytest
-from conftest import MockFitter, MockSessionState
+from conftest import MockFitter
+
+from sans_webapp.mcp_server import (
+    get_model_parameters,
+    list_sans_models,
+    list_sans_models_raw,
+    run_fit,
+    set_fitter,
+    set_model,
+    set_parameter,
+)
+from sans_webapp.services import mcp_state_bridge
+from sans_webapp.services.claude_mcp_client import (
+    ClaudeMCPClient,
+    execute_tool,
+    get_claude_client,
+    get_mcp_tool_schemas,
+    reset_client,
+)
+from sans_webapp.services.mcp_state_bridge import (
+    SessionStateBridge,
+    check_preconditions,
+    check_tools_enabled,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_model_list_cache():
+    """Keep the lru_cache on list_sans_models_raw from carrying patched results across tests."""
+    list_sans_models_raw.cache_clear()
+    yield
+    list_sans_models_raw.cache_clear()
+
+
+@pytest.fixture
+def mock_bridge(monkeypatch):
+    """Make get_state_bridge() return a bridge mock whose checks all pass by default.
+
+    The mock is spec_set to SessionStateBridge, so misspelled or removed bridge
+    methods fail loudly. Tests override only the return values they exercise.
+    """
+    bridge = MagicMock(spec_set=SessionStateBridge)
+    bridge.has_fitter.return_value = True
+    bridge.has_data.return_value = True
+    bridge.has_model.return_value = True
+    bridge.are_tools_enabled.return_value = True
+    monkeypatch.setattr(mcp_state_bridge, 'get_state_bridge', lambda: bridge)
+    return bridge
+
 
 # =============================================================================
 # Test MCP tool schemas
@@ -19,30 +67,25 @@ from conftest import MockFitter, MockSessionState
 class TestMCPToolSchemas:
     """Test the MCP tool schema definitions."""
 
-    def test_get_mcp_tool_schemas_returns_list(self):
-        """Tool schemas should return a list."""
-        from sans_webapp.services.claude_mcp_client import get_mcp_tool_schemas
-
+    def test_get_mcp_tool_schemas_returns_tuple(self):
+        """Tool schemas should be an immutable tuple built once."""
         schemas = get_mcp_tool_schemas()
-        assert isinstance(schemas, list)
+        assert isinstance(schemas, tuple)
         assert len(schemas) == 11  # 11 tools defined
+        assert get_mcp_tool_schemas() is schemas
 
     def test_all_tools_have_required_fields(self):
         """Each tool schema should have name, description, and input_schema."""
-        from sans_webapp.services.claude_mcp_client import get_mcp_tool_schemas
-
-        schemas = get_mcp_tool_schemas()
-        for schema in schemas:
-            assert 'name' in schema
-            assert 'description' in schema
-            assert 'input_schema' in schema
-            assert 'type' in schema['input_schema']
-            assert schema['input_schema']['type'] == 'object'
+        required = {'name', 'description', 'input_schema'}
+        malformed = [
+            schema.get('name', '?')
+            for schema in get_mcp_tool_schemas()
+            if not required.issubset(schema) or schema['input_schema'].get('type') != 'object'
+        ]
+        assert not malformed, f'Malformed tool schemas: {malformed}'
 
     def test_expected_tool_names_present(self):
         """All expected tool names should be present."""
-        from sans_webapp.services.claude_mcp_client import get_mcp_tool_schemas
-
         expected_tools = [
             'list-sans-models',
             'get-model-parameters',
@@ -57,11 +100,9 @@ class TestMCPToolSchemas:
             'run-fit',
         ]
 
-        schemas = get_mcp_tool_schemas()
-        tool_names = [s['name'] for s in schemas]
-
-        for expected in expected_tools:
-            assert expected in tool_names, f"Tool '{expected}' not found in schemas"
+        tool_names = {s['name'] for s in get_mcp_tool_schemas()}
+        missing = set(expected_tools) - tool_names
+        assert not missing, f'Tools not found in schemas: {sorted(missing)}'
 
 
 # =============================================================================
@@ -74,21 +115,23 @@ class TestMCPServerTools:
 
     def test_list_sans_models(self):
         """list_sans_models should return available models."""
-        from sans_webapp.mcp_server import list_sans_models
-
         with patch('sans_webapp.mcp_server.get_all_models') as mock_get_models:
             mock_get_models.return_value = ['sphere', 'cylinder', 'ellipsoid']
 
+            assert list_sans_models_raw() == ('cylinder', 'ellipsoid', 'sphere')
             result = list_sans_models()
+            list_sans_models()
 
-            assert 'sphere' in result
-            assert 'cylinder' in result
-            assert 'ellipsoid' in result
+            mock_get_models.assert_called_once()
+            assert result.startswith('Available SANS models (3):')
+            assert {line.strip('- ') for line in result.splitlines()[1:]} == {
+                'sphere',
+                'cylinder',
+                'ellipsoid',
+            }
 
     def test_get_model_parameters(self):
         """get_model_parameters should return parameter info."""
-        from sans_webapp.mcp_server import get_model_parameters
-
         with patch('sans_webapp.mcp_server.SANSFitter') as MockFitterClass:
             mock_fitter = MockFitter()
             mock_fitter.set_model('sphere')
@@ -99,71 +142,55 @@ class TestMCPServerTools:
             assert 'radius' in result
             assert 'sld' in result
 
+    @pytest.mark.usefixtures('patched_bridge_st')
     def test_set_model_when_tools_enabled(self, mock_fitter, mock_session_state):
         """set_model should work when tools are enabled."""
-        from sans_webapp.mcp_server import set_fitter, set_model
-
         mock_session_state.ai_tools_enabled = True
-        mock_session_state._data['fitter'] = mock_fitter
+        mock_session_state['fitter'] = mock_fitter
         set_fitter(mock_fitter)
 
-        with patch('sans_webapp.services.mcp_state_bridge.st') as mock_st:
-            mock_st.session_state = mock_session_state
+        result = set_model('sphere')
 
-            result = set_model('sphere')
-
-            assert 'sphere' in result
-            assert mock_session_state.current_model == 'sphere'
-            assert mock_session_state.model_selected is True
+        assert 'sphere' in result
+        assert mock_session_state.current_model == 'sphere'
+        assert mock_session_state.model_selected is True
 
+    @pytest.mark.usefixtures('patched_bridge_st')
     def test_set_model_when_tools_disabled(self, mock_fitter, mock_session_state):
         """set_model should refuse when tools are disabled."""
-        from sans_webapp.mcp_server import set_fitter, set_model
-
         mock_session_state.ai_tools_enabled = False
-        mock_session_state._data['fitter'] = mock_fitter
+        mock_session_state['fitter'] = mock_fitter
         set_fitter(mock_fitter)
 
-        with patch('sans_webapp.services.mcp_state_bridge.st') as mock_st:
-            mock_st.session_state = mock_session_state
-
-            result = set_model('sphere')
+        result = set_model('sphere')
 
-            assert 'disabled' in result.lower()
-            assert mock_session_state.model_selected is False
+        assert 'disabled' in result.lower()
+        assert mock_session_state.model_selected is False
 
-    def test_set_parameter(self, mock_fitter, mock_session_state):
+    @pytest.mark.usefixtures('patched_bridge_st')
+    def test_set_parameter(self, mock_sphere_fitter_copy, mock_session_state):
         """set_parameter should update parameter values."""
-        from sans_webapp.mcp_server import set_fitter, set_parameter
-
+        mock_fitter = mock_sphere_fitter_copy
         mock_session_state.ai_tools_enabled = True
-        mock_fitter.set_model('sphere')
-        mock_session_state._data['fitter'] = mock_fitter
+        mock_session_state['fitter'] = mock_fitter
         set_fitter(mock_fitter)
 
-        with patch('sans_webapp.services.mcp_state_bridge.st') as mock_st:
-            mock_st.session_state = mock_session_state
-
-            result = set_parameter('radius', value=100.0)
+        result = set_parameter('radius', value=100.0)
 
-            assert 'radius' in result
-            assert 'updated' in result.lower() or '100' in result
+        assert 'radius' in result
+        assert 'updated' in result.lower() or '100' in result
 
+    @pytest.mark.usefixtures('patched_bridge_st')
     def test_run_fit_requires_data(self, mock_fitter, mock_session_state):
         """run_fit should fail if no data is loaded."""
-        from sans_webapp.mcp_server import run_fit, set_fitter
-
         mock_session_state.ai_tools_enabled = True
         mock_fitter.data = None
-        mock_session_state._data['fitter'] = mock_fitter
+        mock_session_state['fitter'] = mock_fitter
         set_fitter(mock_fitter)
 
-        with patch('sans_webapp.services.mcp_state_bridge.st') as mock_st:
-            mock_st.session_state = mock_session_state
-
-            result = run_fit()
+        result = run_fit()
 
-            assert 'no data' in result.lower() or 'load data' in result.lower()
+        assert 'no data' in result.lower() or 'load data' in result.lower()
 
     def test_fastmcp_unavailable_uses_dummy_fallback(self):
         """If FastMCP import fails, the module should provide a dummy MCP with tool registration."""
@@ -220,33 +247,58 @@ class TestClaudeMCPClient:
 
     def test_execute_tool_unknown_tool(self):
         """execute_tool should handle unknown tools."""
-        from sans_webapp.services.claude_mcp_client import execute_tool
-
         result = execute_tool('unknown-tool', {})
 
         assert 'unknown' in result.lower()
 
     def test_execute_tool_list_models(self):
         """execute_tool should route to list-sans-models."""
-        from sans_webapp.services.claude_mcp_client import execute_tool
-
         with patch('sans_webapp.mcp_server.get_all_models') as mock_get_models:
             mock_get_models.return_value = ['sphere', 'cylinder']
 
             result = execute_tool('list-sans-models', {})
 
-            assert 'sphere' in result
+            mock_get_models.assert_called_once()
+            assert result.startswith('Available SANS models (2):')
 
     def test_client_requires_api_key(self):
         """ClaudeMCPClient should require an API key."""
-        from sans_webapp.services.claude_mcp_client import ClaudeMCPClient
-
         with patch.dict('os.environ', {}, clear=True):
             with pytest.raises(ValueError) as excinfo:
                 ClaudeMCPClient()
 
             assert 'api key' in str(excinfo.value).lower()
 
+    def test_client_validates_key_before_creating_sdk_client(self):
+        """The Anthropic SDK client should only be built once the key is validated."""
+        with patch('anthropic.Anthropic') as MockAnthropic:
+            with patch.dict('os.environ', {}, clear=True):
+                with pytest.raises(ValueError):
+                    ClaudeMCPClient()
+            MockAnthropic.assert_not_called()
+
+            client = ClaudeMCPClient(api_key=' test-key ')
+            MockAnthropic.assert_called_once_with(api_key='test-key')
+            assert client.client is MockAnthropic.return_value
+
+    def test_get_claude_client_reuses_singleton_until_key_changes(self):
+        """get_claude_client should reuse one client and rebuild it on a key change."""
+        reset_client()
+        try:
+            with patch('sans_webapp.services.claude_mcp_client.ClaudeMCPClient') as MockClient:
+                MockClient.side_effect = lambda api_key: MagicMock(api_key=api_key)
+
+                first = get_claude_client('key-a')
+                assert get_claude_client('key-a') is first
+                assert get_claude_client() is first
+
+                second = get_claude_client('key-b')
+                assert second is not first
+                assert second.api_key == 'key-b'
+                assert MockClient.call_count == 2
+        finally:
+            reset_client()
+
 
 # =============================================================================
 # Test session state bridge
@@ -256,102 +308,69 @@ class TestClaudeMCPClient:
 class TestSessionStateBridge:
     """Test the session state bridge."""
 
-    def test_has_fitter_false_when_not_set(self):
+    def test_has_fitter_false_when_not_set(self, patched_bridge_st):
         """has_fitter should return False when fitter not in session state."""
-        from sans_webapp.services.mcp_state_bridge import SessionStateBridge
-
-        with patch('sans_webapp.services.mcp_state_bridge.st') as mock_st:
-            mock_st.session_state = MockSessionState()
+        bridge = SessionStateBridge()
 
-            bridge = SessionStateBridge()
+        # fitter not in mock session state
+        assert bridge.has_fitter() is False
 
-            # fitter not in mock session state
-            assert bridge.has_fitter() is False
-
-    def test_has_fitter_true_when_set(self):
+    def test_has_fitter_true_when_set(self, patched_bridge_st):
         """has_fitter should return True when fitter is set."""
-        from sans_webapp.services.mcp_state_bridge import SessionStateBridge
-
-        with patch('sans_webapp.services.mcp_state_bridge.st') as mock_st:
-            mock_state = MockSessionState()
-            mock_state.fitter = MockFitter()
-            mock_state._data['fitter'] = MockFitter()
-            mock_st.session_state = mock_state
+        patched_bridge_st.fitter = MockFitter()
 
-            bridge = SessionStateBridge()
+        bridge = SessionStateBridge()
 
-            assert bridge.has_fitter() is True
+        assert bridge.has_fitter() is True
 
-    def test_are_tools_enabled(self):
+    def test_are_tools_enabled(self, patched_bridge_st):
         """are_tools_enabled should reflect session state."""
-        from sans_webapp.services.mcp_state_bridge import SessionStateBridge
-
-        with patch('sans_webapp.services.mcp_state_bridge.st') as mock_st:
-            mock_state = MockSessionState()
-            mock_state.ai_tools_enabled = True
-            mock_st.session_state = mock_state
+        patched_bridge_st.ai_tools_enabled = True
 
-            bridge = SessionStateBridge()
+        bridge = SessionStateBridge()
 
-            assert bridge.are_tools_enabled() is True
+        assert bridge.are_tools_enabled() is True
 
-            mock_state.ai_tools_enabled = False
-            assert bridge.are_tools_enabled() is False
+        patched_bridge_st.ai_tools_enabled = False
+        assert bridge.are_tools_enabled() is False
 
-    def test_set_needs_rerun(self):
+    def test_set_needs_rerun(self, patched_bridge_st):
         """set_needs_rerun should update session state."""
-        from sans_webapp.services.mcp_state_bridge import SessionStateBridge
-
-        with patch('sans_webapp.services.mcp_state_bridge.st') as mock_st:
-            mock_state = MockSessionState()
-            mock_st.session_state = mock_state
-
-            bridge = SessionStateBridge()
-            bridge.set_needs_rerun(True)
+        bridge = SessionStateBridge()
+        bridge.set_needs_rerun(True)
 
-            assert mock_state.needs_rerun is True
+        assert patched_bridge_st.needs_rerun is True
 
-    def test_set_fit_status_validates(self):
+    def test_set_fit_status_validates(self, patched_bridge_st):
         """set_fit_status should validate status values."""
-        from sans_webapp.services.mcp_state_bridge import SessionStateBridge
+        bridge = SessionStateBridge()
 
-        with patch('sans_webapp.services.mcp_state_bridge.st') as mock_st:
-            mock_st.session_state = MockSessionState()
+        # Valid status should work
+        bridge.set_fit_status('running')
 
-            bridge = SessionStateBridge()
+        # Invalid status should raise
+        with pytest.raises(ValueError):
+            bridge.set_fit_status('invalid_status')
 
-            # Valid status should work
-            bridge.set_fit_status('running')
-
-            # Invalid status should raise
-            with pytest.raises(ValueError):
-                bridge.set_fit_status('invalid_status')
-
-    def test_chat_history_management(self):
+    def test_chat_history_management(self, patched_bridge_st):
         """Chat history methods should work correctly."""
-        from sans_webapp.services.mcp_state_bridge import SessionStateBridge
-
-        with patch('sans_webapp.services.mcp_state_bridge.st') as mock_st:
-            mock_state = MockSessionState()
-            mock_st.session_state = mock_state
+        bridge = SessionStateBridge()
 
-            bridge = SessionStateBridge()
+        # Start empty
+        assert bridge.get_chat_history() == []
 
-            # Start empty
-            assert bridge.get_chat_history() == []
+        # Append messages
+        bridge.append_chat_message('user', 'Hello')
+        bridge.append_chat_message('assistant', 'Hi there')
 
-            # Append messages
-            bridge.append_chat_message('user', 'Hello')
-            bridge.append_chat_message('assistant', 'Hi there')
+        history = bridge.get_chat_history()
+        assert len(history) == 2
+        assert history[0]['role'] == 'user'
+        assert history[1]['role'] == 'assistant'
 
-            history = bridge.get_chat_history()
-            assert len(history) == 2
-            assert history[0]['role'] == 'user'
-            assert history[1]['role'] == 'assistant'
-
-            # Clear
-            bridge.clear_chat_history()
-            assert bridge.get_chat_history() == []
+        # Clear
+        bridge.clear_chat_history()
+        assert bridge.get_chat_history() == []
 
 
 # =============================================================================
@@ -362,50 +381,30 @@ class TestSessionStateBridge:
 class TestCheckPreconditions:
     """Test the check_preconditions utility function."""
 
-    def test_check_preconditions_no_fitter(self):
+    def test_check_preconditions_no_fitter(self, mock_bridge):
         """Should fail when fitter not available."""
-        from sans_webapp.services.mcp_state_bridge import check_preconditions
-
-        with patch('sans_webapp.services.mcp_state_bridge.get_state_bridge') as mock_get_bridge:
-            mock_bridge = MagicMock()
-            mock_bridge.has_fitter.return_value = False
-            mock_get_bridge.return_value = mock_bridge
+        mock_bridge.has_fitter.return_value = False
 
-            success, message = check_preconditions()
+        success, message = check_preconditions()
 
-            assert success is False
-            assert 'fitter' in message.lower()
+        assert success is False
+        assert 'fitter' in message.lower()
 
-    def test_check_preconditions_require_data(self):
+    def test_check_preconditions_require_data(self, mock_bridge):
         """Should fail when data required but not loaded."""
-        from sans_webapp.services.mcp_state_bridge import check_preconditions
-
-        with patch('sans_webapp.services.mcp_state_bridge.get_state_bridge') as mock_get_bridge:
-            mock_bridge = MagicMock()
-            mock_bridge.has_fitter.return_value = True
-            mock_bridge.has_data.return_value = False
-            mock_get_bridge.return_value = mock_bridge
+        mock_bridge.has_data.return_value = False
 
-            success, message = check_preconditions(require_data=True)
+        success, message = check_preconditions(require_data=True)
 
-            assert success is False
-            assert 'data' in message.lower()
+        assert success is False
+        assert 'data' in message.lower()
 
-    def test_check_preconditions_success(self):
+    def test_check_preconditions_success(self, mock_bridge):
         """Should succeed when all conditions met."""
-        from sans_webapp.services.mcp_state_bridge import check_preconditions
+        success, message = check_preconditions(require_data=True, require_model=True)
 
-        with patch('sans_webapp.services.mcp_state_bridge.get_state_bridge') as mock_get_bridge:
-            mock_bridge = MagicMock()
-            mock_bridge.has_fitter.return_value = True
-            mock_bridge.has_data.return_value = True
-            mock_bridge.has_model.return_value = True
-            mock_get_bridge.return_value = mock_bridge
-
-            success, message = check_preconditions(require_data=True, require_model=True)
-
-            assert success is True
-            assert message == ''
+        assert success is True
+        assert message == ''
 
 
 # =============================================================================
@@ -416,29 +415,17 @@ class TestCheckPreconditions:
 class TestCheckToolsEnabled:
     """Test the check_tools_enabled utility function."""
 
-    def test_check_tools_enabled_when_disabled(self):
+    def test_check_tools_enabled_when_disabled(self, mock_bridge):
         """Should fail when tools are disabled."""
-        from sans_webapp.services.mcp_state_bridge import check_tools_enabled
-
-        with patch('sans_webapp.services.mcp_state_bridge.get_state_bridge') as mock_get_bridge:
-            mock_bridge = MagicMock()
-            mock_bridge.are_tools_enabled.return_value = False
-            mock_get_bridge.return_value = mock_bridge
+        mock_bridge.are_tools_enabled.return_value = False
 
-            enabled, message = check_tools_enabled()
+        enabled, message = check_tools_enabled()
 
-            assert enabled is False
-            assert 'disabled' in message.lower()
+        assert enabled is False
+        assert 'disabled' in message.lower()
 
-    def test_check_tools_enabled_when_enabled(self):
+    def test_check_tools_enabled_when_enabled(self, mock_bridge):
         """Should succeed when tools are enabled."""
-        from sans_webapp.services.mcp_state_bridge import check_tools_enabled
-
-        with patch('sans_webapp.services.mcp_state_bridge.get_state_bridge') as mock_get_bridge:
-            mock_bridge = MagicMock()
-            mock_bridge.are_tools_enabled.return_value = True
-            mock_get_bridge.return_value = mock_bridge
-
-            enabled, message = check_tools_enabled()
+        enabled, message = check_tools_enabled()
 
-            assert enabled is True
+        assert enabled is True
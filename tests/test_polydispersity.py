@@ -11,7 +11,6 @@ Tests cover:
 
 from unittest.mock import MagicMock, patch
 
-import numpy as np
 import pytest
 from sans_fitter import SANSFitter
 
@@ -36,6 +35,10 @@ from sans_webapp.ui_constants import (
     PD_UPDATE_BUTTON,
 )
 
+# Optimizer budget for tests that check which parameters a fit reports, not how
+# well it converges. test_full_pd_workflow_with_fitting runs the fit to completion.
+SMOKE_FIT_STEPS = 5
+
 
 class TestPolydispersityUIConstants:
     """Test polydispersity UI constants."""
@@ -88,6 +91,8 @@ class TestPolydispersitySessionState:
             'fitter': MagicMock(),
             'data_loaded': True,
             'value_radius': 50.0,
+            'min_radius': 1.0,
+            'max_radius': 500.0,
             'vary_radius': True,
             # PD keys
             'pd_enabled': True,
@@ -98,21 +103,20 @@ class TestPolydispersitySessionState:
             'pd_vary_radius': True,
         }
 
-        deleted_keys = []
+        class MockSessionState(dict):
+            """Plain dict that records deleted keys."""
 
-        class MockSessionState:
-            def keys(self):
-                return list(mock_session_state.keys())
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.deleted = []
 
             def __delitem__(self, key):
-                deleted_keys.append(key)
-                del mock_session_state[key]
-
-            def __contains__(self, key):
-                return key in mock_session_state
+                self.deleted.append(key)
+                super().__delitem__(key)
 
         with patch('sans_webapp.services.session_state.st') as mock_st:
-            mock_st.session_state = MockSessionState()
+            mock_st.session_state = MockSessionState(mock_session_state)
+            deleted_keys = mock_st.session_state.deleted
 
             clear_parameter_state()
 
@@ -125,6 +129,8 @@ class TestPolydispersitySessionState:
             assert 'pd_vary_radius' in deleted_keys
             # Standard param keys also deleted
             assert 'value_radius' in deleted_keys
+            assert 'min_radius' in deleted_keys
+            assert 'max_radius' in deleted_keys
             assert 'vary_radius' in deleted_keys
             # Non-param keys preserved
             assert 'fitter' not in deleted_keys
@@ -134,10 +140,9 @@ class TestPolydispersitySessionState:
 class TestApplyPDUpdates:
     """Test apply_pd_updates function."""
 
-    def test_apply_pd_updates_to_fitter(self):
+    def test_apply_pd_updates_to_fitter(self, fitter_factory):
         """Test that PD updates are correctly applied to fitter."""
-        fitter = SANSFitter()
-        fitter.set_model('sphere')
+        fitter = fitter_factory('sphere')
 
         pd_updates: dict[str, PDUpdate] = {
             'radius': {
@@ -156,10 +161,9 @@ class TestApplyPDUpdates:
         assert pd_config['pd_type'] == 'lognormal'
         assert pd_config['vary'] is True
 
-    def test_apply_pd_updates_multiple_params(self):
+    def test_apply_pd_updates_multiple_params(self, fitter_factory):
         """Test applying PD updates to multiple parameters."""
-        fitter = SANSFitter()
-        fitter.set_model('cylinder')
+        fitter = fitter_factory('cylinder')
 
         pd_updates: dict[str, PDUpdate] = {
             'radius': {
@@ -193,153 +197,116 @@ class TestApplyPDUpdates:
 class TestPolydispersityWorkflow:
     """Test complete polydispersity workflow integration."""
 
-    def test_full_pd_workflow_with_fitting(self):
+    @pytest.mark.slow
+    @pytest.mark.integration
+    def test_full_pd_workflow_with_fitting(self, synthetic_sphere_csv):
         """Test full workflow: load data → set model → enable PD → configure → fit."""
-        import os
-        import tempfile
-
-        # Create test data file
-        temp_file = tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False)
-        temp_file.write('Q,I,dI\n')
-        q = np.logspace(-2, 0, 30)
-        intensity = 0.01 * (1 / (1 + (q * 50) ** 2)) + 0.001
-        d_intensity = intensity * 0.1
-        for qi, intensity_i, d_intensity_i in zip(q, intensity, d_intensity):
-            temp_file.write(f'{qi},{intensity_i},{d_intensity_i}\n')
-        temp_file.close()
-
-        try:
-            # 1. Initialize fitter and load data
-            fitter = SANSFitter()
-            fitter.load_data(temp_file.name)
-
-            # 2. Set model
-            fitter.set_model('sphere')
-            assert fitter.supports_polydispersity()
-
-            # 3. Configure basic parameters
-            fitter.set_param('radius', value=50.0, min=10.0, max=100.0, vary=True)
-            fitter.set_param('scale', value=0.01, min=0.001, max=1.0, vary=True)
-            fitter.set_param('background', value=0.001, min=0, max=0.1, vary=True)
-            fitter.set_param('sld', value=4.0, vary=False)
-            fitter.set_param('sld_solvent', value=1.0, vary=False)
-
-            # 4. Enable polydispersity
-            fitter.enable_polydispersity(True)
-            assert fitter.is_polydispersity_enabled()
-
-            # 5. Configure PD parameters (simulating what apply_pd_updates does)
-            pd_updates: dict[str, PDUpdate] = {
-                'radius': {
-                    'pd_width': 0.1,
-                    'pd_n': 35,
-                    'pd_type': 'gaussian',
-                    'vary': True,
-                }
-            }
-            apply_pd_updates(fitter, pd_updates)
+        # 1. Initialize fitter and load data
+        fitter = SANSFitter()
+        fitter.load_data(synthetic_sphere_csv)
 
-            # 6. Verify PD configuration
-            pd_config = fitter.get_pd_param('radius')
-            assert pd_config['pd'] == 0.1
-            assert pd_config['vary'] is True
+        # 2. Set model
+        fitter.set_model('sphere')
+        assert fitter.supports_polydispersity()
 
-            # 7. Fit with polydispersity
-            result = fitter.fit(engine='bumps', method='amoeba')
-            assert result is not None
-            assert 'chisq' in result
-            assert 'radius_pd' in result['parameters']
+        # 3. Configure basic parameters
+        fitter.set_param('radius', value=50.0, min=10.0, max=100.0, vary=True)
+        fitter.set_param('scale', value=0.01, min=0.001, max=1.0, vary=True)
+        fitter.set_param('background', value=0.001, min=0, max=0.1, vary=True)
+        fitter.set_param('sld', value=4.0, vary=False)
+        fitter.set_param('sld_solvent', value=1.0, vary=False)
 
-        finally:
-            os.unlink(temp_file.name)
+        # 4. Enable polydispersity
+        fitter.enable_polydispersity(True)
+        assert fitter.is_polydispersity_enabled()
 
-    def test_pd_disabled_excludes_from_fit(self):
+        # 5. Configure PD parameters (simulating what apply_pd_updates does)
+        pd_updates: dict[str, PDUpdate] = {
+            'radius': {
+                'pd_width': 0.1,
+                'pd_n': 35,
+                'pd_type': 'gaussian',
+                'vary': True,
+            }
+        }
+        apply_pd_updates(fitter, pd_updates)
+
+        # 6. Verify PD configuration
+        pd_config = fitter.get_pd_param('radius')
+        assert pd_config['pd'] == 0.1
+        assert pd_config['vary'] is True
+
+        # 7. Fit with polydispersity
+        result = fitter.fit(engine='bumps', method='amoeba')
+        assert result is not None
+        assert 'chisq' in result
+        assert 'radius_pd' in result['parameters']
+
+    def test_pd_disabled_excludes_from_fit(self, synthetic_sphere_csv):
         """Test that PD params are excluded when polydispersity is disabled."""
-        import os
-        import tempfile
-
-        # Create test data file
-        temp_file = tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False)
-        temp_file.write('Q,I,dI\n')
-        q = np.logspace(-2, 0, 30)
-        intensity = 0.01 * (1 / (1 + (q * 50) ** 2)) + 0.001
-        d_intensity = intensity * 0.1
-        for qi, intensity_i, d_intensity_i in zip(q, intensity, d_intensity):
-            temp_file.write(f'{qi},{intensity_i},{d_intensity_i}\n')
-        temp_file.close()
-
-        try:
-            fitter = SANSFitter()
-            fitter.load_data(temp_file.name)
-            fitter.set_model('sphere')
-
-            # Configure parameters
-            fitter.set_param('radius', value=50.0, min=10.0, max=100.0, vary=True)
-            fitter.set_param('scale', value=0.01, vary=True)
-            fitter.set_param('background', value=0.001, vary=True)
-            fitter.set_param('sld', value=4.0, vary=False)
-            fitter.set_param('sld_solvent', value=1.0, vary=False)
-
-            # Configure PD but keep disabled
-            fitter.set_pd_param('radius', pd_width=0.1, vary=True)
-            fitter.enable_polydispersity(False)
-
-            # Fit
-            result = fitter.fit(engine='bumps', method='amoeba')
-            assert result is not None
-
-            # PD params should NOT be in results
-            assert 'radius_pd' not in result['parameters']
-
-        finally:
-            os.unlink(temp_file.name)
+        fitter = SANSFitter()
+        fitter.load_data(synthetic_sphere_csv)
+        fitter.set_model('sphere')
+
+        # Configure parameters
+        fitter.set_param('radius', value=50.0, min=10.0, max=100.0, vary=True)
+        fitter.set_param('scale', value=0.01, vary=True)
+        fitter.set_param('background', value=0.001, vary=True)
+        fitter.set_param('sld', value=4.0, vary=False)
+        fitter.set_param('sld_solvent', value=1.0, vary=False)
+
+        # Configure PD but keep disabled
+        fitter.set_pd_param('radius', pd_width=0.1, vary=True)
+        fitter.enable_polydispersity(False)
+
+        # Fit
+        result = fitter.fit(engine='bumps', method='amoeba', steps=SMOKE_FIT_STEPS)
+        assert result is not None
+
+        # PD params should NOT be in results
+        assert 'radius_pd' not in result['parameters']
 
 
 class TestPolydispersityMultipleModels:
     """Test polydispersity with different model types."""
 
-    def test_sphere_pd_params(self):
+    def test_sphere_pd_params(self, fitter_factory):
         """Test sphere model polydispersity parameters."""
-        fitter = SANSFitter()
-        fitter.set_model('sphere')
+        fitter = fitter_factory('sphere', read_only=True)
 
         assert fitter.supports_polydispersity()
         pd_params = fitter.get_polydisperse_parameters()
         assert 'radius' in pd_params
 
-    def test_cylinder_pd_params(self):
+    def test_cylinder_pd_params(self, fitter_factory):
         """Test cylinder model polydispersity parameters."""
-        fitter = SANSFitter()
-        fitter.set_model('cylinder')
+        fitter = fitter_factory('cylinder', read_only=True)
 
         assert fitter.supports_polydispersity()
         pd_params = fitter.get_polydisperse_parameters()
         assert 'radius' in pd_params
         assert 'length' in pd_params
 
-    def test_ellipsoid_pd_params(self):
+    def test_ellipsoid_pd_params(self, fitter_factory):
         """Test ellipsoid model polydispersity parameters."""
-        fitter = SANSFitter()
-        fitter.set_model('ellipsoid')
+        fitter = fitter_factory('ellipsoid', read_only=True)
 
         assert fitter.supports_polydispersity()
         pd_params = fitter.get_polydisperse_parameters()
         # Ellipsoid has radius_polar and radius_equatorial
         assert len(pd_params) >= 2
 
-    def test_core_shell_sphere_pd_params(self):
+    def test_core_shell_sphere_pd_params(self, fitter_factory):
         """Test core_shell_sphere model polydispersity parameters."""
-        fitter = SANSFitter()
-        fitter.set_model('core_shell_sphere')
+        fitter = fitter_factory('core_shell_sphere', read_only=True)
 
         assert fitter.supports_polydispersity()
         pd_params = fitter.get_polydisperse_parameters()
         assert len(pd_params) >= 1
 
-    def test_model_switch_resets_pd(self):
+    def test_model_switch_resets_pd(self, fitter_factory):
         """Test that switching models resets polydispersity state."""
-        fitter = SANSFitter()
-        fitter.set_model('sphere')
+        fitter = fitter_factory('sphere')
 
         # Configure PD
         fitter.set_pd_param('radius', pd_width=0.2, pd_type='lognormal')
@@ -353,14 +320,10 @@ class TestPolydispersityMultipleModels:
         pd_config = fitter.get_pd_param('radius')
         assert pd_config['pd'] == 0.0  # Back to default
 
-    def test_model_switch_pd_session_state_cleanup(self):
+    def test_model_switch_pd_session_state_cleanup(self, fitter_factory):
         """Test that switching models clears stale PD session state keys."""
-        from unittest.mock import MagicMock, patch
-
-        fitter = SANSFitter()
-
         # Start with sphere model
-        fitter.set_model('sphere')
+        fitter = fitter_factory('sphere')
         fitter.enable_polydispersity(True)
 
         # Simulate session state with PD enabled
@@ -396,9 +359,7 @@ class TestPolydispersityMultipleModels:
             mock_st.info = MagicMock()
             mock_st.checkbox = MagicMock(return_value=False)
 
-            # Import and call render function - this should trigger validation
-            from sans_webapp.components.parameters import render_polydispersity_tab
-
+            # Call render function - this should trigger validation
             render_polydispersity_tab(fitter)
 
             # Verify that stale session state was cleared
@@ -409,55 +370,19 @@ class TestPolydispersityMultipleModels:
 class TestPolydispersityDistributionTypes:
     """Test different polydispersity distribution types."""
 
-    def test_gaussian_distribution(self):
-        """Test setting Gaussian distribution."""
-        fitter = SANSFitter()
-        fitter.set_model('sphere')
-        fitter.set_pd_param('radius', pd_width=0.1, pd_type='gaussian')
-
-        pd_config = fitter.get_pd_param('radius')
-        assert pd_config['pd_type'] == 'gaussian'
-
-    def test_lognormal_distribution(self):
-        """Test setting lognormal distribution."""
-        fitter = SANSFitter()
-        fitter.set_model('sphere')
-        fitter.set_pd_param('radius', pd_width=0.1, pd_type='lognormal')
-
-        pd_config = fitter.get_pd_param('radius')
-        assert pd_config['pd_type'] == 'lognormal'
-
-    def test_schulz_distribution(self):
-        """Test setting Schulz distribution."""
-        fitter = SANSFitter()
-        fitter.set_model('sphere')
-        fitter.set_pd_param('radius', pd_width=0.1, pd_type='schulz')
-
-        pd_config = fitter.get_pd_param('radius')
-        assert pd_config['pd_type'] == 'schulz'
-
-    def test_rectangle_distribution(self):
-        """Test setting rectangle distribution."""
-        fitter = SANSFitter()
-        fitter.set_model('sphere')
-        fitter.set_pd_param('radius', pd_width=0.1, pd_type='rectangle')
+    @pytest.mark.parametrize('dist', ['gaussian', 'lognormal', 'schulz', 'rectangle', 'boltzmann'])
+    def test_distribution(self, fitter_factory, dist):
+        """Test setting each supported distribution type."""
+        fitter = fitter_factory('sphere')
+        fitter.set_pd_param('radius', pd_width=0.1, pd_type=dist)
 
         pd_config = fitter.get_pd_param('radius')
-        assert pd_config['pd_type'] == 'rectangle'
+        assert pd_config['pd_type'] == dist
 
-    def test_boltzmann_distribution(self):
-        """Test setting Boltzmann distribution."""
-        fitter = SANSFitter()
-        fitter.set_model('sphere')
-        fitter.set_pd_param('radius', pd_width=0.1, pd_type='boltzmann')
-
-        pd_config = fitter.get_pd_param('radius')
-        assert pd_config['pd_type'] == 'boltzmann'
-
-    def test_invalid_distribution_raises_error(self):
+    def test_invalid_distribution_raises_error(self, fitter_factory):
         """Test that invalid distribution type raises error."""
-        fitter = SANSFitter()
-        fitter.set_model('sphere')
+        # set_pd_param validates pd_type before touching state, so the shared fitter is safe
+        fitter = fitter_factory('sphere', read_only=True)
 
         with pytest.raises(ValueError):
             fitter.set_pd_param('radius', pd_type='invalid_distribution')
@@ -466,48 +391,31 @@ class TestPolydispersityDistributionTypes:
 class TestPolydispersityWithStructureFactor:
     """Test polydispersity combined with structure factors."""
 
-    def test_pd_with_hardsphere_structure(self):
+    def test_pd_with_hardsphere_structure(self, synthetic_sphere_csv):
         """Test polydispersity with hardsphere structure factor."""
-        import os
-        import tempfile
-
-        # Create test data
-        temp_file = tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False)
-        temp_file.write('Q,I,dI\n')
-        q = np.logspace(-2, 0, 30)
-        intensity = 0.01 * (1 / (1 + (q * 50) ** 2)) + 0.001
-        d_intensity = intensity * 0.1
-        for qi, intensity_i, d_intensity_i in zip(q, intensity, d_intensity):
-            temp_file.write(f'{qi},{intensity_i},{d_intensity_i}\n')
-        temp_file.close()
-
-        try:
-            fitter = SANSFitter()
-            fitter.load_data(temp_file.name)
-            fitter.set_model('sphere')
-
-            # Add structure factor
-            fitter.set_structure_factor('hardsphere')
-            fitter.set_param('volfraction', value=0.2, min=0.0, max=0.6, vary=True)
-
-            # Configure PD
-            fitter.enable_polydispersity(True)
-            fitter.set_pd_param('radius', pd_width=0.1, vary=False)
-
-            # Set up remaining params
-            fitter.set_param('radius', value=50.0, min=10.0, max=100.0, vary=True)
-            fitter.set_param('scale', value=0.01, vary=True)
-            fitter.set_param('background', value=0.001, vary=True)
-            fitter.set_param('radius_effective', value=50.0, vary=True)
-
-            # Fit should work with both PD and structure factor
-            result = fitter.fit(engine='bumps', method='amoeba')
-            assert result is not None
-            assert 'chisq' in result
-            assert 'volfraction' in result['parameters']
-
-        finally:
-            os.unlink(temp_file.name)
+        fitter = SANSFitter()
+        fitter.load_data(synthetic_sphere_csv)
+        fitter.set_model('sphere')
+
+        # Add structure factor
+        fitter.set_structure_factor('hardsphere')
+        fitter.set_param('volfraction', value=0.2, min=0.0, max=0.6, vary=True)
+
+        # Configure PD
+        fitter.enable_polydispersity(True)
+        fitter.set_pd_param('radius', pd_width=0.1, vary=False)
+
+        # Set up remaining params
+        fitter.set_param('radius', value=50.0, min=10.0, max=100.0, vary=True)
+        fitter.set_param('scale', value=0.01, vary=True)
+        fitter.set_param('background', value=0.001, vary=True)
+        fitter.set_param('radius_effective', value=50.0, vary=True)
+
+        # Fit should work with both PD and structure factor
+        result = fitter.fit(engine='bumps', method='amoeba', steps=SMOKE_FIT_STEPS)
+        assert result is not None
+        assert 'chisq' in result
+        assert 'volfraction' in result['parameters']
 
 
 if __name__ == '__main__':
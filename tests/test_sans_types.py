@@ -21,9 +21,12 @@ def test_mcp_tool_result_fields():
 
 
 def test_chat_message_with_tools():
-    sample_tool = MCPToolResult(
-        tool_name='set-model', input={'model_name': 'sphere'}, result='OK', success=True
-    )
+    sample_tool: MCPToolResult = {
+        'tool_name': 'set-model',
+        'input': {'model_name': 'sphere'},
+        'result': 'OK',
+        'success': True,
+    }
 
     msg: ChatMessage = {
         'role': 'assistant',
@@ -4,39 +4,33 @@ Unit tests for the AI chat sidebar component.
 Tests the changes made to sidebar.py in Step 6.
 """
 
-from unittest.mock import MagicMock, PropertyMock, patch
+from unittest.mock import MagicMock, PropertyMock
 
 import pytest
 
+from sans_webapp.components.sidebar import render_ai_chat_sidebar
+
 
 class MockSessionState:
-    """Mock for Streamlit session_state."""
+    """Mock for Streamlit session_state.
+
+    Only the keys the chat sidebar touches are supported, each stored in a slot.
+    """
+
+    __slots__ = ('ai_tools_enabled', 'needs_rerun', 'show_ai_chat', 'chat_history', 'fitter')
 
     def __init__(self):
-        self._data = {
-            'ai_tools_enabled': False,
-            'needs_rerun': False,
-            'show_ai_chat': True,
-            'chat_history': [],
-            'fitter': None,
-        }
-
-    def __getattr__(self, name):
-        if name.startswith('_'):
-            return super().__getattribute__(name)
-        return self._data.get(name)
-
-    def __setattr__(self, name, value):
-        if name.startswith('_'):
-            super().__setattr__(name, value)
-        else:
-            self._data[name] = value
+        self.ai_tools_enabled = False
+        self.needs_rerun = False
+        self.show_ai_chat = True
+        self.chat_history = []
+        self.fitter = None
 
     def get(self, key, default=None):
-        return self._data.get(key, default)
+        return getattr(self, key, default)
 
     def __contains__(self, key):
-        return key in self._data
+        return hasattr(self, key)
 
 
 class MockFitter:
@@ -60,47 +54,64 @@ def mock_fitter():
     return MockFitter()
 
 
-@pytest.fixture
+STREAMLIT_API = (
+    'button',
+    'caption',
+    'columns',
+    'container',
+    'expander',
+    'info',
+    'markdown',
+    'rerun',
+    'session_state',
+    'sidebar',
+    'status',
+    'success',
+    'text_area',
+    'toggle',
+    'write',
+)
+
+
+def _cm_mock():
+    """MagicMock usable in a with-statement, yielding itself."""
+    m = MagicMock()
+    m.__enter__ = MagicMock(return_value=m)
+    m.__exit__ = MagicMock(return_value=False)
+    return m
+
+
+@pytest.fixture(scope='module')
 def mock_streamlit():
-    """Create a comprehensive mock for Streamlit."""
-    with patch('sans_webapp.components.sidebar.st') as mock_st:
-        # Setup mock session state
-        mock_st.session_state = MockSessionState()
-
-        # Setup sidebar context manager
-        mock_sidebar = MagicMock()
-        mock_st.sidebar = mock_sidebar
-
-        # Setup expander context manager
-        mock_expander = MagicMock()
-        mock_expander.__enter__ = MagicMock(return_value=mock_expander)
-        mock_expander.__exit__ = MagicMock(return_value=False)
-        mock_sidebar.expander.return_value = mock_expander
-
-        # Setup columns
-        mock_col1 = MagicMock()
-        mock_col2 = MagicMock()
-        mock_col1.__enter__ = MagicMock(return_value=mock_col1)
-        mock_col1.__exit__ = MagicMock(return_value=False)
-        mock_col2.__enter__ = MagicMock(return_value=mock_col2)
-        mock_col2.__exit__ = MagicMock(return_value=False)
-        mock_st.columns.return_value = [mock_col1, mock_col2]
-
-        # Setup container
-        mock_container = MagicMock()
-        mock_container.__enter__ = MagicMock(return_value=mock_container)
-        mock_container.__exit__ = MagicMock(return_value=False)
-        mock_st.container.return_value = mock_container
-
-        # Setup status
-        mock_status = MagicMock()
-        mock_status.__enter__ = MagicMock(return_value=mock_status)
-        mock_status.__exit__ = MagicMock(return_value=False)
-        mock_st.status.return_value = mock_status
-
+    """Create a comprehensive mock for Streamlit, shared by every test in this module.
+
+    _reset_streamlit gives each test a fresh session state and clears recorded calls.
+    """
+    # spec_set pins the child mocks to the Streamlit API the sidebar actually uses
+    mock_st = MagicMock(spec_set=STREAMLIT_API)
+    mock_st.sidebar = _cm_mock()
+    mock_st.expander.return_value = _cm_mock()
+    mock_st.columns.return_value = [_cm_mock(), _cm_mock()]
+    mock_st.container.return_value = _cm_mock()
+    mock_st.status.return_value = _cm_mock()
+
+    # monkeypatch is function-scoped, so use a MonkeyPatch context for the module
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr('sans_webapp.components.sidebar.st', mock_st)
         yield mock_st
 
 
+@pytest.fixture(autouse=True)
+def _reset_streamlit(mock_streamlit):
+    """Isolate tests sharing the module-scoped mock_streamlit."""
+    mock_streamlit.session_state = MockSessionState()
+    yield
+    mock_streamlit.reset_mock()
+    # Tests may configure toggle/button results; restore the default MagicMock returns
+    mock_streamlit.toggle.reset_mock(return_value=True)
+    mock_streamlit.button.reset_mock(return_value=True)
+
+
 # =============================================================================
 # Test render_ai_chat_sidebar
 # =============================================================================
@@ -109,51 +120,20 @@ def mock_streamlit():
 class TestRenderAIChatSidebar:
     """Test the render_ai_chat_sidebar function."""
 
-    def test_renders_without_error(self, mock_streamlit, mock_fitter):
-        """Function should render without raising exceptions."""
-        from sans_webapp.components.sidebar import render_ai_chat_sidebar
-
-        # Should not raise
-        render_ai_chat_sidebar(api_key='test-key', fitter=mock_fitter)
-
-    def test_renders_toggle_for_ai_tools(self, mock_streamlit, mock_fitter):
-        """Should render an AI tools toggle."""
-        from sans_webapp.components.sidebar import render_ai_chat_sidebar
-
-        render_ai_chat_sidebar(api_key='test-key', fitter=mock_fitter)
-
-        # Check that toggle was called
-        mock_streamlit.toggle.assert_called()
-
-    def test_renders_text_area_for_input(self, mock_streamlit, mock_fitter):
-        """Should render a text area for chat input."""
-        from sans_webapp.components.sidebar import render_ai_chat_sidebar
-
-        render_ai_chat_sidebar(api_key='test-key', fitter=mock_fitter)
-
-        # Check that text_area was called
-        mock_streamlit.text_area.assert_called()
-
-    def test_renders_send_button(self, mock_streamlit, mock_fitter):
-        """Should render a send button."""
-        from sans_webapp.components.sidebar import render_ai_chat_sidebar
-
+    @pytest.mark.parametrize('widget', ['toggle', 'text_area', 'button', 'markdown', 'caption'])
+    def test_renders_widget(self, mock_streamlit, mock_fitter, widget):
+        """Should render without error and draw the given Streamlit widget."""
         render_ai_chat_sidebar(api_key='test-key', fitter=mock_fitter)
 
-        # Check that button was called (at least once for send/clear buttons)
-        assert mock_streamlit.button.called
+        getattr(mock_streamlit, widget).assert_called()
 
     def test_handles_none_api_key(self, mock_streamlit, mock_fitter):
         """Should handle None API key gracefully."""
-        from sans_webapp.components.sidebar import render_ai_chat_sidebar
-
         # Should not raise
         render_ai_chat_sidebar(api_key=None, fitter=mock_fitter)
 
     def test_handles_none_fitter(self, mock_streamlit):
         """Should handle None fitter gracefully."""
-        from sans_webapp.components.sidebar import render_ai_chat_sidebar
-
         # Should not raise
         render_ai_chat_sidebar(api_key='test-key', fitter=None)
 
@@ -166,10 +146,13 @@ class TestRenderAIChatSidebar:
 class TestChatHistoryDisplay:
     """Test the chat history display logic."""
 
+    @pytest.fixture(autouse=True)
+    def _no_button_clicked(self, mock_streamlit):
+        """Leave Send/Clear unclicked so the seeded history is what gets rendered."""
+        mock_streamlit.button.return_value = False
+
     def test_displays_empty_history(self, mock_streamlit, mock_fitter):
         """Should show caption when history is empty."""
-        from sans_webapp.components.sidebar import render_ai_chat_sidebar
-
         mock_streamlit.session_state.chat_history = []
 
         render_ai_chat_sidebar(api_key='test-key', fitter=mock_fitter)
@@ -179,20 +162,31 @@ class TestChatHistoryDisplay:
 
     def test_displays_messages_in_history(self, mock_streamlit, mock_fitter):
         """Should display messages when history has content."""
-        from sans_webapp.components.sidebar import render_ai_chat_sidebar
-
         mock_streamlit.session_state.chat_history = [
             {'role': 'user', 'content': 'Hello'},
             {'role': 'assistant', 'content': 'Hi there!'},
         ]
-        mock_streamlit.session_state._data['chat_history'] = (
-            mock_streamlit.session_state.chat_history
-        )
 
         render_ai_chat_sidebar(api_key='test-key', fitter=mock_fitter)
 
-        # Check that markdown was called (for message headers)
-        mock_streamlit.markdown.assert_called()
+        # Each message is rendered as one box with the role header inside it
+        mock_streamlit.info.assert_called_once_with('**🧑 You:**\n\nHello')
+        mock_streamlit.success.assert_called_once_with('**🤖 Assistant:**\n\nHi there!')
+
+    @pytest.mark.parametrize('n_messages', [2, 100])
+    def test_renders_one_element_per_message(self, mock_streamlit, mock_fitter, n_messages):
+        """Each message should cost exactly one info/success element, with no extra markdown."""
+        mock_streamlit.session_state.chat_history = [
+            {'role': ('user', 'assistant')[i % 2], 'content': f'Message {i}'}
+            for i in range(n_messages)
+        ]
+
+        render_ai_chat_sidebar(api_key='test-key', fitter=mock_fitter)
+
+        assert mock_streamlit.info.call_count + mock_streamlit.success.call_count == n_messages
+        # Role headers live inside those boxes, not in separate markdown calls
+        markdown_text = [c.args[0] for c in mock_streamlit.markdown.call_args_list]
+        assert not any('You:**' in t or 'Assistant:**' in t for t in markdown_text)
 
 
 # =============================================================================
@@ -205,10 +199,7 @@ class TestNeedsRerunHandling:
 
     def test_triggers_rerun_when_flag_set(self, mock_streamlit, mock_fitter):
         """Should trigger rerun when needs_rerun is True."""
-        from sans_webapp.components.sidebar import render_ai_chat_sidebar
-
         mock_streamlit.session_state.needs_rerun = True
-        mock_streamlit.session_state._data['needs_rerun'] = True
 
         render_ai_chat_sidebar(api_key='test-key', fitter=mock_fitter)
 
@@ -225,19 +216,22 @@ class TestNeedsRerunHandling:
 class TestAIToolsToggle:
     """Test the AI tools enabled toggle."""
 
-    def test_toggle_updates_session_state(self, mock_streamlit, mock_fitter):
+    @pytest.mark.parametrize(
+        'enabled, caption',
+        [
+            (True, '✅ AI can modify model parameters and run fits'),
+            (False, '🔒 AI is in read-only mode (chat only)'),
+        ],
+        ids=['enabled', 'disabled'],
+    )
+    def test_toggle_updates_session_state(self, mock_streamlit, mock_fitter, enabled, caption):
         """Toggle should update ai_tools_enabled in session state."""
-        from sans_webapp.components.sidebar import render_ai_chat_sidebar
-
-        # Simulate toggle returning True
-        mock_streamlit.toggle.return_value = True
+        mock_streamlit.toggle.return_value = enabled
 
         render_ai_chat_sidebar(api_key='test-key', fitter=mock_fitter)
 
-        # Check toggle was called with correct parameters
-        toggle_calls = mock_streamlit.toggle.call_args_list
-        assert len(toggle_calls) > 0
-
         # First call should be for AI tools toggle
-        call_args = toggle_calls[0]
+        call_args = mock_streamlit.toggle.call_args_list[0]
         assert 'tool' in str(call_args).lower() or 'ai' in str(call_args).lower()
+        assert mock_streamlit.session_state.ai_tools_enabled is enabled
+        mock_streamlit.caption.assert_any_call(caption)
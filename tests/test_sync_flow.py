@@ -5,101 +5,88 @@ Tests the complete sync flow: tool execution -> bridge state update -> session_s
 Verifies SYNC-01, SYNC-02, SYNC-03, SYNC-04, SYNC-05, SYNC-06 requirements.
 """
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
-from conftest import MockFitter, MockSessionState
+from conftest import MockFitter
 
-# =============================================================================
-# SYNC-01: set-model tool state synchronization
-# =============================================================================
-
-
-class TestSyncSetModel:
-    """Test SYNC-01: set-model tool state synchronization."""
-
-    def test_set_model_updates_current_model(self, mock_fitter, mock_session_state):
-        """set-model should update st.session_state.current_model."""
-        from sans_webapp.mcp_server import set_fitter, set_model
-
-        mock_session_state._data['fitter'] = mock_fitter
-        set_fitter(mock_fitter)
-
-        with patch('sans_webapp.services.mcp_state_bridge.st') as mock_st:
-            mock_st.session_state = mock_session_state
-
-            result = set_model('cylinder')
-
-            assert 'cylinder' in result
-            assert mock_session_state.current_model == 'cylinder'
+from sans_webapp.mcp_server import (
+    enable_polydispersity,
+    remove_structure_factor,
+    run_fit,
+    set_fitter,
+    set_model,
+    set_multiple_parameters,
+    set_parameter,
+    set_structure_factor,
+)
 
-    def test_set_model_sets_model_selected_flag(self, mock_fitter, mock_session_state):
-        """set-model should set model_selected to True."""
-        from sans_webapp.mcp_server import set_fitter, set_model
+# Every sync test drives the bridge through the test's MockSessionState
+pytestmark = pytest.mark.usefixtures('patched_bridge_st')
 
-        mock_session_state._data['fitter'] = mock_fitter
-        mock_session_state.model_selected = False
-        set_fitter(mock_fitter)
 
-        with patch('sans_webapp.services.mcp_state_bridge.st') as mock_st:
-            mock_st.session_state = mock_session_state
+@pytest.fixture
+def mock_fitter(mock_sphere_fitter_copy):
+    """Sphere-model mock fitter: a per-test copy of the session template."""
+    return mock_sphere_fitter_copy
 
-            set_model('sphere')
 
-            assert mock_session_state.model_selected is True
+@pytest.fixture(autouse=True)
+def _bind_fitter(mock_fitter, mock_session_state):
+    """Install the test's mock fitter in session_state and the MCP server."""
+    mock_session_state['fitter'] = mock_fitter
+    set_fitter(mock_fitter)
 
-    def test_set_model_clears_fit_completed(self, mock_fitter, mock_session_state):
-        """set-model should reset fit_completed to False."""
-        from sans_webapp.mcp_server import set_fitter, set_model
 
-        mock_session_state._data['fitter'] = mock_fitter
-        mock_session_state.fit_completed = True  # Was True from previous fit
-        set_fitter(mock_fitter)
-
-        with patch('sans_webapp.services.mcp_state_bridge.st') as mock_st:
-            mock_st.session_state = mock_session_state
-
-            set_model('ellipsoid')
-
-            assert mock_session_state.fit_completed is False
+# =============================================================================
+# SYNC-01: set-model tool state synchronization
+# =============================================================================
 
-    def test_set_model_sets_needs_rerun(self, mock_fitter, mock_session_state):
-        """set-model should set needs_rerun to True for UI refresh."""
-        from sans_webapp.mcp_server import set_fitter, set_model
 
-        mock_session_state._data['fitter'] = mock_fitter
-        mock_session_state.needs_rerun = False
-        set_fitter(mock_fitter)
+class TestSyncSetModel:
+    """Test SYNC-01: set-model tool state synchronization."""
 
-        with patch('sans_webapp.services.mcp_state_bridge.st') as mock_st:
-            mock_st.session_state = mock_session_state
+    @pytest.fixture
+    def mock_fitter(self):
+        """set-model starts from a fitter with no model loaded."""
+        return MockFitter()
+
+    @pytest.mark.parametrize(
+        'model_name, preset, key, expected',
+        [
+            ('cylinder', {}, 'current_model', 'cylinder'),
+            ('sphere', {'model_selected': False}, 'model_selected', True),
+            ('ellipsoid', {'fit_completed': True}, 'fit_completed', False),
+            ('sphere', {'needs_rerun': False}, 'needs_rerun', True),
+        ],
+        ids=['current_model', 'model_selected', 'clears_fit_completed', 'needs_rerun'],
+    )
+    def test_set_model_updates_session_flag(
+        self, mock_fitter, mock_session_state, model_name, preset, key, expected
+    ):
+        """set-model should update the model flags in st.session_state."""
+        mock_session_state.update(preset)
 
-            set_model('sphere')
+        result = set_model(model_name)
 
-            assert mock_session_state.needs_rerun is True
+        assert model_name in result
+        assert mock_session_state[key] == expected
 
     def test_set_model_clears_old_parameter_widgets(self, mock_fitter, mock_session_state):
         """set-model should clear old parameter widget keys."""
-        from sans_webapp.mcp_server import set_fitter, set_model
-
         # Set up old parameter widget state
-        mock_session_state._data['value_old_param'] = 100.0
-        mock_session_state._data['min_old_param'] = 0.0
-        mock_session_state._data['max_old_param'] = 200.0
-        mock_session_state._data['vary_old_param'] = True
-        mock_session_state._data['fitter'] = mock_fitter
-        set_fitter(mock_fitter)
-
-        with patch('sans_webapp.services.mcp_state_bridge.st') as mock_st:
-            mock_st.session_state = mock_session_state
+        mock_session_state['value_old_param'] = 100.0
+        mock_session_state['min_old_param'] = 0.0
+        mock_session_state['max_old_param'] = 200.0
+        mock_session_state['vary_old_param'] = True
 
-            set_model('sphere')
+        set_model('sphere')
 
-            # Old parameter widget keys should be cleared
-            assert 'value_old_param' not in mock_session_state._data
-            assert 'min_old_param' not in mock_session_state._data
-            assert 'max_old_param' not in mock_session_state._data
-            assert 'vary_old_param' not in mock_session_state._data
+        # Old parameter widget keys should be cleared
+        assert 'value_old_param' not in mock_session_state
+        assert 'min_old_param' not in mock_session_state
+        assert 'max_old_param' not in mock_session_state
+        assert 'vary_old_param' not in mock_session_state
 
 
 # =============================================================================
@@ -110,99 +97,41 @@ class TestSyncSetModel:
 class TestSyncSetParameter:
     """Test SYNC-02: set-parameter tool widget synchronization."""
 
-    def test_set_parameter_updates_value_widget(self, mock_fitter, mock_session_state):
-        """set-parameter should update value_{name} in session_state."""
-        from sans_webapp.mcp_server import set_fitter, set_parameter
-
-        mock_fitter.set_model('sphere')
-        mock_session_state._data['fitter'] = mock_fitter
-        set_fitter(mock_fitter)
-
-        with patch('sans_webapp.services.mcp_state_bridge.st') as mock_st:
-            mock_st.session_state = mock_session_state
-
-            set_parameter('radius', value=75.0)
-
-            assert mock_session_state._data['value_radius'] == 75.0
-
-    def test_set_parameter_updates_min_widget(self, mock_fitter, mock_session_state):
-        """set-parameter should update min_{name} when min_bound provided."""
-        from sans_webapp.mcp_server import set_fitter, set_parameter
-
-        mock_fitter.set_model('sphere')
-        mock_session_state._data['fitter'] = mock_fitter
-        set_fitter(mock_fitter)
-
-        with patch('sans_webapp.services.mcp_state_bridge.st') as mock_st:
-            mock_st.session_state = mock_session_state
-
-            set_parameter('radius', min_bound=10.0)
-
-            assert mock_session_state._data['min_radius'] == 10.0
-
-    def test_set_parameter_updates_max_widget(self, mock_fitter, mock_session_state):
-        """set-parameter should update max_{name} when max_bound provided."""
-        from sans_webapp.mcp_server import set_fitter, set_parameter
-
-        mock_fitter.set_model('sphere')
-        mock_session_state._data['fitter'] = mock_fitter
-        set_fitter(mock_fitter)
-
-        with patch('sans_webapp.services.mcp_state_bridge.st') as mock_st:
-            mock_st.session_state = mock_session_state
-
-            set_parameter('radius', max_bound=200.0)
-
-            assert mock_session_state._data['max_radius'] == 200.0
-
-    def test_set_parameter_updates_vary_widget(self, mock_fitter, mock_session_state):
-        """set-parameter should update vary_{name} when vary provided."""
-        from sans_webapp.mcp_server import set_fitter, set_parameter
-
-        mock_fitter.set_model('sphere')
-        mock_session_state._data['fitter'] = mock_fitter
-        set_fitter(mock_fitter)
-
-        with patch('sans_webapp.services.mcp_state_bridge.st') as mock_st:
-            mock_st.session_state = mock_session_state
-
-            set_parameter('radius', vary=False)
+    @pytest.mark.parametrize(
+        'kwargs, key, expected',
+        [
+            ({'value': 75.0}, 'value_radius', 75.0),
+            ({'min_bound': 10.0}, 'min_radius', 10.0),
+            ({'max_bound': 200.0}, 'max_radius', 200.0),
+            ({'vary': False}, 'vary_radius', False),
+        ],
+        ids=['value', 'min', 'max', 'vary'],
+    )
+    def test_set_parameter_updates_widget(
+        self, mock_fitter, mock_session_state, kwargs, key, expected
+    ):
+        """set-parameter should update the {field}_{name} widget key it was given."""
+        set_parameter('radius', **kwargs)
 
-            assert mock_session_state._data['vary_radius'] is False
+        assert mock_session_state[key] == expected
+        assert type(mock_session_state[key]) is type(expected)
 
     def test_set_parameter_sets_needs_rerun(self, mock_fitter, mock_session_state):
         """set-parameter should set needs_rerun for UI refresh."""
-        from sans_webapp.mcp_server import set_fitter, set_parameter
-
-        mock_fitter.set_model('sphere')
-        mock_session_state._data['fitter'] = mock_fitter
         mock_session_state.needs_rerun = False
-        set_fitter(mock_fitter)
-
-        with patch('sans_webapp.services.mcp_state_bridge.st') as mock_st:
-            mock_st.session_state = mock_session_state
 
-            set_parameter('radius', value=60.0)
+        set_parameter('radius', value=60.0)
 
-            assert mock_session_state.needs_rerun is True
+        assert mock_session_state.needs_rerun is True
 
     def test_set_parameter_updates_all_widgets_at_once(self, mock_fitter, mock_session_state):
         """set-parameter should update all provided widget values."""
-        from sans_webapp.mcp_server import set_fitter, set_parameter
-
-        mock_fitter.set_model('sphere')
-        mock_session_state._data['fitter'] = mock_fitter
-        set_fitter(mock_fitter)
-
-        with patch('sans_webapp.services.mcp_state_bridge.st') as mock_st:
-            mock_st.session_state = mock_session_state
-
-            set_parameter('radius', value=80.0, min_bound=5.0, max_bound=300.0, vary=True)
+        set_parameter('radius', value=80.0, min_bound=5.0, max_bound=300.0, vary=True)
 
-            assert mock_session_state._data['value_radius'] == 80.0
-            assert mock_session_state._data['min_radius'] == 5.0
-            assert mock_session_state._data['max_radius'] == 300.0
-            assert mock_session_state._data['vary_radius'] is True
+        assert mock_session_state['value_radius'] == 80.0
+        assert mock_session_state['min_radius'] == 5.0
+        assert mock_session_state['max_radius'] == 300.0
+        assert mock_session_state['vary_radius'] is True
 
 
 # =============================================================================
@@ -215,122 +144,131 @@ class TestSyncSetMultipleParameters:
 
     def test_set_multiple_parameters_updates_all_values(self, mock_fitter, mock_session_state):
         """set-multiple-parameters should update all specified values."""
-        from sans_webapp.mcp_server import set_fitter, set_multiple_parameters
+        set_multiple_parameters(
+            {
+                'radius': {'value': 45.0},
+                'scale': {'value': 2.0},
+            }
+        )
 
-        mock_fitter.set_model('sphere')
-        mock_session_state._data['fitter'] = mock_fitter
-        set_fitter(mock_fitter)
-
-        with patch('sans_webapp.services.mcp_state_bridge.st') as mock_st:
-            mock_st.session_state = mock_session_state
-
-            set_multiple_parameters(
-                {
-                    'radius': {'value': 45.0},
-                    'scale': {'value': 2.0},
-                }
-            )
-
-            assert mock_session_state._data['value_radius'] == 45.0
-            assert mock_session_state._data['value_scale'] == 2.0
+        assert mock_session_state['value_radius'] == 45.0
+        assert mock_session_state['value_scale'] == 2.0
 
     def test_set_multiple_parameters_updates_bounds(self, mock_fitter, mock_session_state):
         """set-multiple-parameters should update bounds for all specified."""
-        from sans_webapp.mcp_server import set_fitter, set_multiple_parameters
-
-        mock_fitter.set_model('sphere')
-        mock_session_state._data['fitter'] = mock_fitter
-        set_fitter(mock_fitter)
-
-        with patch('sans_webapp.services.mcp_state_bridge.st') as mock_st:
-            mock_st.session_state = mock_session_state
-
-            set_multiple_parameters(
-                {
-                    'radius': {'min': 10.0, 'max': 100.0},
-                    'scale': {'min': 0.5, 'max': 5.0},
-                }
-            )
-
-            assert mock_session_state._data['min_radius'] == 10.0
-            assert mock_session_state._data['max_radius'] == 100.0
-            assert mock_session_state._data['min_scale'] == 0.5
-            assert mock_session_state._data['max_scale'] == 5.0
+        set_multiple_parameters(
+            {
+                'radius': {'min': 10.0, 'max': 100.0},
+                'scale': {'min': 0.5, 'max': 5.0},
+            }
+        )
+
+        assert mock_session_state['min_radius'] == 10.0
+        assert mock_session_state['max_radius'] == 100.0
+        assert mock_session_state['min_scale'] == 0.5
+        assert mock_session_state['max_scale'] == 5.0
 
     def test_set_multiple_parameters_updates_vary_flags(self, mock_fitter, mock_session_state):
         """set-multiple-parameters should update vary flags for all specified."""
-        from sans_webapp.mcp_server import set_fitter, set_multiple_parameters
-
-        mock_fitter.set_model('sphere')
-        mock_session_state._data['fitter'] = mock_fitter
-        set_fitter(mock_fitter)
-
-        with patch('sans_webapp.services.mcp_state_bridge.st') as mock_st:
-            mock_st.session_state = mock_session_state
+        set_multiple_parameters(
+            {
+                'radius': {'vary': True},
+                'background': {'vary': False},
+            }
+        )
 
-            set_multiple_parameters(
-                {
-                    'radius': {'vary': True},
-                    'background': {'vary': False},
-                }
-            )
-
-            assert mock_session_state._data['vary_radius'] is True
-            assert mock_session_state._data['vary_background'] is False
+        assert mock_session_state['vary_radius'] is True
+        assert mock_session_state['vary_background'] is False
 
     def test_set_multiple_parameters_single_rerun(self, mock_fitter, mock_session_state):
         """set-multiple-parameters should set needs_rerun once at end."""
-        from sans_webapp.mcp_server import set_fitter, set_multiple_parameters
-
-        mock_fitter.set_model('sphere')
-        mock_session_state._data['fitter'] = mock_fitter
         mock_session_state.needs_rerun = False
-        set_fitter(mock_fitter)
-
-        with patch('sans_webapp.services.mcp_state_bridge.st') as mock_st:
-            mock_st.session_state = mock_session_state
 
-            set_multiple_parameters(
-                {
-                    'radius': {'value': 50.0},
-                    'scale': {'value': 1.5},
-                    'background': {'value': 0.01},
-                }
-            )
+        set_multiple_parameters(
+            {
+                'radius': {'value': 50.0},
+                'scale': {'value': 1.5},
+                'background': {'value': 0.01},
+            }
+        )
+
+        # needs_rerun should be True (set once at end)
+        assert mock_session_state.needs_rerun is True
+
+    @pytest.mark.parametrize(
+        'preset, parameters',
+        [
+            ({}, {}),
+            ({}, {'unknown_param': {'value': 1.0}}),
+            (
+                {'value_radius': 50.0, 'vary_radius': True},
+                {'radius': {'value': 50.0, 'vary': True}},
+            ),
+        ],
+        ids=['empty', 'unknown_only', 'unchanged'],
+    )
+    def test_noop_does_not_trigger_rerun(self, mock_fitter, mock_session_state, preset, parameters):
+        """set-multiple-parameters should not request a rerun when no widget changes."""
+        mock_session_state.update(preset)
+        mock_session_state.needs_rerun = False
 
-            # needs_rerun should be True (set once at end)
-            assert mock_session_state.needs_rerun is True
+        set_multiple_parameters(parameters)
 
-    def test_set_multiple_parameters_mixed_updates(self, mock_fitter, mock_session_state):
-        """set-multiple-parameters should handle mixed value/bounds/vary updates."""
-        from sans_webapp.mcp_server import set_fitter, set_multiple_parameters
+        assert mock_session_state.needs_rerun is False
 
-        mock_fitter.set_model('sphere')
-        mock_session_state._data['fitter'] = mock_fitter
-        set_fitter(mock_fitter)
+    def test_fitter_change_triggers_rerun_when_widgets_match(self, mock_fitter, mock_session_state):
+        """A fitter change should request a rerun even if the widget already shows it."""
+        # Widget and fitter out of sync, e.g. after a fit
+        mock_fitter.params['radius']['value'] = 30.0
+        mock_session_state['value_radius'] = 50.0
+        mock_session_state.needs_rerun = False
 
-        with patch('sans_webapp.services.mcp_state_bridge.st') as mock_st:
-            mock_st.session_state = mock_session_state
+        set_multiple_parameters({'radius': {'value': 50.0}})
 
-            set_multiple_parameters(
-                {
-                    'radius': {'value': 60.0, 'min': 10.0, 'max': 200.0, 'vary': True},
-                    'scale': {'value': 1.2},
-                    'background': {'vary': False},
-                }
-            )
+        assert mock_fitter.params['radius']['value'] == 50.0
+        assert mock_session_state.needs_rerun is True
 
-            # radius should have all updates
-            assert mock_session_state._data['value_radius'] == 60.0
-            assert mock_session_state._data['min_radius'] == 10.0
-            assert mock_session_state._data['max_radius'] == 200.0
-            assert mock_session_state._data['vary_radius'] is True
+    def test_set_multiple_parameters_mixed_updates(self, mock_fitter, mock_session_state):
+        """set-multiple-parameters should handle mixed value/bounds/vary updates."""
+        set_multiple_parameters(
+            {
+                'radius': {'value': 60.0, 'min': 10.0, 'max': 200.0, 'vary': True},
+                'scale': {'value': 1.2},
+                'background': {'vary': False},
+            }
+        )
+
+        # radius should have all updates
+        assert mock_session_state['value_radius'] == 60.0
+        assert mock_session_state['min_radius'] == 10.0
+        assert mock_session_state['max_radius'] == 200.0
+        assert mock_session_state['vary_radius'] is True
+
+        # scale should have value update
+        assert mock_session_state['value_scale'] == 1.2
+
+        # background should have vary update
+        assert mock_session_state['vary_background'] is False
+
+    def test_set_multiple_parameters_batches_widget_writes(
+        self, mock_fitter, mock_session_state, monkeypatch
+    ):
+        """set-multiple-parameters should write all widget keys in one update."""
+        # Attribute writes land in the dict itself, so spy on the class instead
+        update = MagicMock(side_effect=lambda *args: dict.update(mock_session_state, *args))
+        monkeypatch.setattr(type(mock_session_state), 'update', update)
 
-            # scale should have value update
-            assert mock_session_state._data['value_scale'] == 1.2
+        set_multiple_parameters(
+            {
+                'radius': {'value': 60.0, 'vary': True},
+                'scale': {'min': 0.5},
+                'unknown_param': {'value': 1.0},
+            }
+        )
 
-            # background should have vary update
-            assert mock_session_state._data['vary_background'] is False
+        update.assert_called_once_with(
+            {'value_radius': 60.0, 'vary_radius': True, 'min_scale': 0.5}
+        )
 
 
 # =============================================================================
@@ -341,73 +279,51 @@ class TestSyncSetMultipleParameters:
 class TestSyncRunFit:
     """Test SYNC-04: run-fit tool parameter synchronization."""
 
-    def _setup_fitter_for_fit(self, mock_fitter, mock_session_state):
+    def _setup_fitter_for_fit(self, mock_fitter):
         """Common setup: fitter with model, data, and fit() returning a result."""
-        mock_fitter.set_model('sphere')
         mock_fitter.data = MagicMock()
         mock_result = MagicMock(redchi=1.5)
         mock_fitter.fit = MagicMock(return_value=mock_result)
         mock_fitter.result = mock_result
-        mock_session_state._data['fitter'] = mock_fitter
 
     def test_run_fit_sets_fit_completed(self, mock_fitter, mock_session_state):
         """run-fit should set fit_completed to True."""
-        from sans_webapp.mcp_server import run_fit, set_fitter
-
-        self._setup_fitter_for_fit(mock_fitter, mock_session_state)
-        set_fitter(mock_fitter)
-
-        with patch('sans_webapp.services.mcp_state_bridge.st') as mock_st:
-            mock_st.session_state = mock_session_state
+        self._setup_fitter_for_fit(mock_fitter)
 
-            run_fit()
+        run_fit()
 
-            assert mock_session_state.fit_completed is True
+        assert mock_session_state.fit_completed is True
 
     def test_run_fit_sets_fit_result(self, mock_fitter, mock_session_state):
         """run-fit should set fit_result in session_state."""
-        from sans_webapp.mcp_server import run_fit, set_fitter
+        self._setup_fitter_for_fit(mock_fitter)
 
-        self._setup_fitter_for_fit(mock_fitter, mock_session_state)
-        set_fitter(mock_fitter)
+        run_fit()
 
-        with patch('sans_webapp.services.mcp_state_bridge.st') as mock_st:
-            mock_st.session_state = mock_session_state
-
-            run_fit()
-
-            assert mock_session_state.fit_result is not None
-            assert mock_session_state.fit_result.redchi == 1.5
+        assert mock_session_state.fit_result is not None
+        assert mock_session_state.fit_result.redchi == 1.5
 
     def test_run_fit_syncs_varied_parameter_values(self, mock_fitter, mock_session_state):
         """run-fit should sync fitted values to value_{param} widget keys."""
-        from sans_webapp.mcp_server import run_fit, set_fitter
-
-        self._setup_fitter_for_fit(mock_fitter, mock_session_state)
+        self._setup_fitter_for_fit(mock_fitter)
         # Simulate optimizer updating values
         mock_fitter.params['radius']['value'] = 62.3
         mock_fitter.params['radius']['vary'] = True
         mock_fitter.params['sld']['value'] = 2.5e-6
         mock_fitter.params['sld']['vary'] = True
         mock_fitter.params['sld_solvent']['vary'] = False  # Not varied
-        set_fitter(mock_fitter)
 
-        with patch('sans_webapp.services.mcp_state_bridge.st') as mock_st:
-            mock_st.session_state = mock_session_state
+        run_fit()
 
-            run_fit()
-
-            # Varied params should be synced
-            assert mock_session_state._data['value_radius'] == 62.3
-            assert mock_session_state._data['value_sld'] == 2.5e-6
-            # Non-varied param should NOT be synced
-            assert 'value_sld_solvent' not in mock_session_state._data
+        # Varied params should be synced
+        assert mock_session_state['value_radius'] == 62.3
+        assert mock_session_state['value_sld'] == 2.5e-6
+        # Non-varied param should NOT be synced
+        assert 'value_sld_solvent' not in mock_session_state
 
     def test_run_fit_syncs_pd_parameter_values(self, mock_fitter, mock_session_state):
         """run-fit should sync fitted PD values to pd_width_{param} widget keys."""
-        from sans_webapp.mcp_server import run_fit, set_fitter
-
-        self._setup_fitter_for_fit(mock_fitter, mock_session_state)
+        self._setup_fitter_for_fit(mock_fitter)
         # Add a PD parameter that was varied during fit
         mock_fitter.params['radius_pd'] = {
             'value': 0.15,
@@ -416,31 +332,21 @@ class TestSyncRunFit:
             'vary': True,
             'description': '',
         }
-        set_fitter(mock_fitter)
-
-        with patch('sans_webapp.services.mcp_state_bridge.st') as mock_st:
-            mock_st.session_state = mock_session_state
 
-            run_fit()
+        run_fit()
 
-            # PD param should be synced to both value_ and pd_width_ keys
-            assert mock_session_state._data['value_radius_pd'] == 0.15
-            assert mock_session_state._data['pd_width_radius'] == 0.15
+        # PD param should be synced to both value_ and pd_width_ keys
+        assert mock_session_state['value_radius_pd'] == 0.15
+        assert mock_session_state['pd_width_radius'] == 0.15
 
     def test_run_fit_sets_needs_rerun(self, mock_fitter, mock_session_state):
         """run-fit should set needs_rerun for UI refresh."""
-        from sans_webapp.mcp_server import run_fit, set_fitter
-
-        self._setup_fitter_for_fit(mock_fitter, mock_session_state)
+        self._setup_fitter_for_fit(mock_fitter)
         mock_session_state.needs_rerun = False
-        set_fitter(mock_fitter)
-
-        with patch('sans_webapp.services.mcp_state_bridge.st') as mock_st:
-            mock_st.session_state = mock_session_state
 
-            run_fit()
+        run_fit()
 
-            assert mock_session_state.needs_rerun is True
+        assert mock_session_state.needs_rerun is True
 
 
 # =============================================================================
@@ -451,9 +357,8 @@ class TestSyncRunFit:
 class TestSyncPolydispersity:
     """Test SYNC-05: enable-polydispersity tool state synchronization."""
 
-    def _setup_fitter_with_pd(self, mock_fitter, mock_session_state):
+    def _setup_fitter_with_pd(self, mock_fitter):
         """Common setup: fitter with model that has PD parameters."""
-        mock_fitter.set_model('sphere')
         mock_fitter.params['radius_pd'] = {
             'value': 0.1,
             'min': 0,
@@ -461,78 +366,47 @@ class TestSyncPolydispersity:
             'vary': False,
             'description': '',
         }
-        mock_session_state._data['fitter'] = mock_fitter
 
     def test_enable_polydispersity_sets_pd_enabled(self, mock_fitter, mock_session_state):
         """enable-polydispersity should set pd_enabled to True."""
-        from sans_webapp.mcp_server import enable_polydispersity, set_fitter
-
-        self._setup_fitter_with_pd(mock_fitter, mock_session_state)
-        set_fitter(mock_fitter)
+        self._setup_fitter_with_pd(mock_fitter)
 
-        with patch('sans_webapp.services.mcp_state_bridge.st') as mock_st:
-            mock_st.session_state = mock_session_state
+        enable_polydispersity('radius')
 
-            enable_polydispersity('radius')
-
-            assert mock_session_state.pd_enabled is True
+        assert mock_session_state.pd_enabled is True
 
     def test_enable_polydispersity_sets_pd_width(self, mock_fitter, mock_session_state):
         """enable-polydispersity should set pd_width_{param} in session_state."""
-        from sans_webapp.mcp_server import enable_polydispersity, set_fitter
-
-        self._setup_fitter_with_pd(mock_fitter, mock_session_state)
-        set_fitter(mock_fitter)
-
-        with patch('sans_webapp.services.mcp_state_bridge.st') as mock_st:
-            mock_st.session_state = mock_session_state
+        self._setup_fitter_with_pd(mock_fitter)
 
-            enable_polydispersity('radius', pd_value=0.15)
+        enable_polydispersity('radius', pd_value=0.15)
 
-            assert mock_session_state._data['pd_width_radius'] == 0.15
+        assert mock_session_state['pd_width_radius'] == 0.15
 
     def test_enable_polydispersity_sets_pd_type(self, mock_fitter, mock_session_state):
         """enable-polydispersity should set pd_type_{param} in session_state."""
-        from sans_webapp.mcp_server import enable_polydispersity, set_fitter
+        self._setup_fitter_with_pd(mock_fitter)
 
-        self._setup_fitter_with_pd(mock_fitter, mock_session_state)
-        set_fitter(mock_fitter)
+        enable_polydispersity('radius', pd_type='lognormal')
 
-        with patch('sans_webapp.services.mcp_state_bridge.st') as mock_st:
-            mock_st.session_state = mock_session_state
-
-            enable_polydispersity('radius', pd_type='lognormal')
-
-            assert mock_session_state._data['pd_type_radius'] == 'lognormal'
+        assert mock_session_state['pd_type_radius'] == 'lognormal'
 
     def test_enable_polydispersity_sets_pd_vary(self, mock_fitter, mock_session_state):
         """enable-polydispersity should set pd_vary_{param} to True."""
-        from sans_webapp.mcp_server import enable_polydispersity, set_fitter
-
-        self._setup_fitter_with_pd(mock_fitter, mock_session_state)
-        set_fitter(mock_fitter)
+        self._setup_fitter_with_pd(mock_fitter)
 
-        with patch('sans_webapp.services.mcp_state_bridge.st') as mock_st:
-            mock_st.session_state = mock_session_state
+        enable_polydispersity('radius')
 
-            enable_polydispersity('radius')
-
-            assert mock_session_state._data['pd_vary_radius'] is True
+        assert mock_session_state['pd_vary_radius'] is True
 
     def test_enable_polydispersity_sets_needs_rerun(self, mock_fitter, mock_session_state):
         """enable-polydispersity should set needs_rerun for UI refresh."""
-        from sans_webapp.mcp_server import enable_polydispersity, set_fitter
-
-        self._setup_fitter_with_pd(mock_fitter, mock_session_state)
+        self._setup_fitter_with_pd(mock_fitter)
         mock_session_state.needs_rerun = False
-        set_fitter(mock_fitter)
-
-        with patch('sans_webapp.services.mcp_state_bridge.st') as mock_st:
-            mock_st.session_state = mock_session_state
 
-            enable_polydispersity('radius')
+        enable_polydispersity('radius')
 
-            assert mock_session_state.needs_rerun is True
+        assert mock_session_state.needs_rerun is True
 
 
 # =============================================================================
@@ -545,82 +419,50 @@ class TestSyncStructureFactor:
 
     def test_set_structure_factor_clears_parameter_widgets(self, mock_fitter, mock_session_state):
         """set-structure-factor should clear old parameter widget keys."""
-        from sans_webapp.mcp_server import set_fitter, set_structure_factor
-
-        mock_fitter.set_model('sphere')
-        mock_session_state._data['fitter'] = mock_fitter
         # Pre-existing parameter widgets
-        mock_session_state._data['value_radius'] = 50.0
-        mock_session_state._data['min_radius'] = 1.0
-        mock_session_state._data['max_radius'] = 500.0
-        mock_session_state._data['vary_radius'] = True
-        set_fitter(mock_fitter)
-
-        with patch('sans_webapp.services.mcp_state_bridge.st') as mock_st:
-            mock_st.session_state = mock_session_state
+        mock_session_state['value_radius'] = 50.0
+        mock_session_state['min_radius'] = 1.0
+        mock_session_state['max_radius'] = 500.0
+        mock_session_state['vary_radius'] = True
 
-            set_structure_factor('hardsphere')
+        set_structure_factor('hardsphere')
 
-            # Old parameter widget keys should be cleared
-            assert 'value_radius' not in mock_session_state._data
-            assert 'min_radius' not in mock_session_state._data
-            assert 'max_radius' not in mock_session_state._data
-            assert 'vary_radius' not in mock_session_state._data
+        # Old parameter widget keys should be cleared
+        assert 'value_radius' not in mock_session_state
+        assert 'min_radius' not in mock_session_state
+        assert 'max_radius' not in mock_session_state
+        assert 'vary_radius' not in mock_session_state
 
     def test_set_structure_factor_sets_needs_rerun(self, mock_fitter, mock_session_state):
         """set-structure-factor should set needs_rerun for UI refresh."""
-        from sans_webapp.mcp_server import set_fitter, set_structure_factor
-
-        mock_fitter.set_model('sphere')
-        mock_session_state._data['fitter'] = mock_fitter
         mock_session_state.needs_rerun = False
-        set_fitter(mock_fitter)
 
-        with patch('sans_webapp.services.mcp_state_bridge.st') as mock_st:
-            mock_st.session_state = mock_session_state
+        set_structure_factor('hardsphere')
 
-            set_structure_factor('hardsphere')
-
-            assert mock_session_state.needs_rerun is True
+        assert mock_session_state.needs_rerun is True
 
     def test_remove_structure_factor_clears_parameter_widgets(
         self, mock_fitter, mock_session_state
     ):
         """remove-structure-factor should clear parameter widget keys."""
-        from sans_webapp.mcp_server import remove_structure_factor, set_fitter
-
-        mock_fitter.set_model('sphere')
-        mock_session_state._data['fitter'] = mock_fitter
         # Pre-existing widgets (including SF params)
-        mock_session_state._data['value_radius'] = 50.0
-        mock_session_state._data['vary_radius'] = True
-        mock_session_state._data['value_volfraction'] = 0.2
-        mock_session_state._data['vary_volfraction'] = True
-        set_fitter(mock_fitter)
-
-        with patch('sans_webapp.services.mcp_state_bridge.st') as mock_st:
-            mock_st.session_state = mock_session_state
+        mock_session_state['value_radius'] = 50.0
+        mock_session_state['vary_radius'] = True
+        mock_session_state['value_volfraction'] = 0.2
+        mock_session_state['vary_volfraction'] = True
 
-            remove_structure_factor()
+        remove_structure_factor()
 
-            # All parameter widget keys should be cleared
-            assert 'value_radius' not in mock_session_state._data
-            assert 'vary_radius' not in mock_session_state._data
-            assert 'value_volfraction' not in mock_session_state._data
-            assert 'vary_volfraction' not in mock_session_state._data
+        # All parameter widget keys should be cleared
+        assert 'value_radius' not in mock_session_state
+        assert 'vary_radius' not in mock_session_state
+        assert 'value_volfraction' not in mock_session_state
+        assert 'vary_volfraction' not in mock_session_state
 
     def test_remove_structure_factor_sets_needs_rerun(self, mock_fitter, mock_session_state):
         """remove-structure-factor should set needs_rerun for UI refresh."""
-        from sans_webapp.mcp_server import remove_structure_factor, set_fitter
-
-        mock_fitter.set_model('sphere')
-        mock_session_state._data['fitter'] = mock_fitter
         mock_session_state.needs_rerun = False
-        set_fitter(mock_fitter)
-
-        with patch('sans_webapp.services.mcp_state_bridge.st') as mock_st:
-            mock_st.session_state = mock_session_state
 
-            remove_structure_factor()
+        remove_structure_factor()
 
-            assert mock_session_state.needs_rerun is True
+        assert mock_session_state.needs_rerun is True